@@ -1,34 +1,234 @@
 import os
+import sys
 import time
-import json
+import random
+import orjson
 import secrets
+import hashlib
 import logging
+import logging.handlers
+import queue
+import atexit
 import urllib.parse
 from pathlib import Path
 import requests
-import urllib.parse
-import base64
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, lru_cache
+from collections import deque
+from itertools import chain, islice
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging. Records are handed to a queue and written to disk by a
+# background listener thread, so logging never blocks the request workers.
 log_dir = Path(__file__).parent / 'logs'
 log_dir.mkdir(exist_ok=True)
-logging.basicConfig(
-    filename=log_dir / 'event_sync.log',
-    level=logging.INFO,
-    format='[%(asctime)s] [%(name)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+_log_file_handler = logging.FileHandler(log_dir / 'event_sync.log')
+_log_file_handler.setFormatter(logging.Formatter('[%(asctime)s] [%(name)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+_log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler, respect_handler_level=True)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# The queue carries the bare message; the listener's handlers apply their own format
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+log_listener.start()
+# Drain queued records before logging shuts down at interpreter exit
+atexit.register(log_listener.stop)
+
+# Token file locations. NXT shares its token directory with the PHP implementation.
+SR_TOKEN_DIR = Path.home() / '.tokens'
+NXT_TOKEN_DIR = Path(__file__).parent.parent / 'ServiceReefAPI' / 'tokens'
+
+# Seconds to wait on a ServiceReef/NXT connection or read before giving up
+REQUEST_TIMEOUT = 30
+
+# Upper bound in seconds for a single retry backoff
+MAX_RETRY_DELAY = 30
+
+# Upper bound for SYNC_MAX_WORKERS; event and participant pools nest, so the HTTP
+# connection pool is sized by the square of the worker count
+MAX_SYNC_WORKERS = 16
+
+def _atomic_write_bytes(path, data):
+    """Write bytes to a file atomically.
+    
+    The data is written to a temporary sibling file which then replaces the
+    target, so a crash mid-write never leaves a truncated file behind. The
+    data is synced before the rename because callers (compact()) discard the
+    mapping logs once the write returns.
+    
+    Args:
+        path: Path of the file to write
+        data: Bytes to write
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _pretty_json(data):
+    """Format data as indented JSON for log output.
+    
+    Args:
+        data: JSON-compatible data; anything else is rendered with str()
+        
+    Returns:
+        str: Indented JSON text
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+def _compact_json(data):
+    """Format data as single-line JSON for log output.
+    
+    Args:
+        data: JSON-compatible data; anything else is rendered with str()
+        
+    Returns:
+        str: Compact JSON text
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+@lru_cache(maxsize=1024)
+def _format_nxt_date(value):
+    """Convert a ServiceReef date string to the YYYY-MM-DD form NXT requires.
+    
+    Related ServiceReef events often share dates, so results are cached.
+    
+    Args:
+        value: Non-empty date string, usually ISO 8601 (e.g. 2024-06-15T09:30:00Z)
+        
+    Returns:
+        str: Date in YYYY-MM-DD format
+    """
+    # The date portion of ISO 8601 is simply the first ten characters
+    if len(value) >= 10 and value[4] == '-' and value[7] == '-':
+        return value[:10]
+        
+    # Otherwise extract just the date portion
+    if 'T' in value:
+        value = value.split('T')[0]
+    elif ' ' in value:
+        value = value.split(' ')[0]
+        
+    # Ensure date format is YYYY-MM-DD
+    if '/' in value:
+        parts = value.split('/')
+        if len(parts) == 3:
+            if len(parts[2]) == 4:  # MM/DD/YYYY format
+                return f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
+            # DD/MM/YYYY format
+            return f"{parts[2]}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
+    return value
+
+def _sr_event_id(event):
+    """Resolve a ServiceReef event's ID, preferring EventId over Id.
+    
+    Args:
+        event: Event dict from ServiceReef
+        
+    Returns:
+        str: The event ID as a string, or None if the event has neither field
+    """
+    event_id = event.get('EventId') or event.get('Id')
+    return str(event_id) if event_id else None
+
+def _sr_user_id(participant):
+    """Resolve a ServiceReef participant's member ID, preferring UserId over Id.
+    
+    Args:
+        participant: Participant dict from ServiceReef
+        
+    Returns:
+        str: The member ID as a string, or None if the participant has neither field
+    """
+    user_id = participant.get('UserId') or participant.get('Id')
+    return str(user_id) if user_id else None
+
+def _intern_mapping(mapping):
+    """Normalize a loaded ID mapping to interned string keys and values.
+    
+    Interning lets the same ID share one string object across the mappings,
+    caches and hash file, which keeps large tenants' mappings compact.
+    
+    Args:
+        mapping: Dict of ServiceReef ID -> NXT ID as loaded from JSON
+        
+    Returns:
+        dict: Mapping with interned str keys and values (None values kept)
+    """
+    intern = sys.intern
+    # JSON object keys are always strings and this code only ever writes string
+    # IDs, so only legacy non-string values need converting
+    return {intern(k): v if v is None else intern(v if isinstance(v, str) else str(v))
+            for k, v in mapping.items()}
+
+def _backoff_delay(base_delay, attempt, retry_after=None):
+    """Compute how long to wait before retrying a failed request.
+    
+    Args:
+        base_delay: Delay in seconds before the first retry
+        attempt: Zero-based number of the attempt that just failed
+        retry_after: Optional Retry-After header value from the response
+        
+    Returns:
+        float: Seconds to sleep, capped at MAX_RETRY_DELAY
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), MAX_RETRY_DELAY)
+        except ValueError:
+            # HTTP-date form; fall back to the computed backoff
+            pass
+    # Exponential backoff with jitter so concurrent workers do not retry in lockstep
+    return min(base_delay * (2 ** attempt) + random.uniform(0, 0.25), MAX_RETRY_DELAY)
+
+class NxtApiError(Exception):
+    """Error response from the NXT API, raised when a caller asks for it.
+    
+    Args:
+        status_code: HTTP status code of the response
+        body: Parsed JSON error body, or the raw text if it was not JSON
+        retry_after: Retry-After header of the response, if any
+    """
+    
+    def __init__(self, status_code, body, retry_after=None):
+        super().__init__(f"NXT API error {status_code}")
+        self.status_code = status_code
+        self.body = body
+        self.retry_after = retry_after
 
 class TokenService:
-    def __init__(self, service_type):
+    # Fixed attribute set; avoids a per-instance __dict__ on the request hot path
+    __slots__ = (
+        'service_type', 'logger', 'token_file', 'session', '_lock',
+        '_cached_token', '_cached_expiry', '_token_data', '_token_file_stamp', '_refresh_timer',
+        'client_id', 'client_secret', 'token_endpoint', 'auth_endpoint', 'redirect_uri',
+        'env_access_token', 'env_refresh_token', 'nxt_base_url', '_token_body', '_refresh_body'
+    )
+    
+    def __init__(self, service_type, session=None):
         self.service_type = service_type
         self.logger = logging.getLogger(f"{service_type}TokenService")
         self.token_file = None
+        # Shared HTTP session for token endpoint calls (keep-alive)
+        self.session = session or requests.Session()
+        self._lock = threading.RLock()
+        # In-memory copy of the current token so the hot path skips file I/O
+        self._cached_token = None
+        self._cached_expiry = 0.0
+        # Background timer that renews the token before the cached copy expires
+        self._refresh_timer = None
+        # Parsed token file contents, reloaded only when the file changes on disk
+        self._token_data = None
+        self._token_file_stamp = None
         
         if service_type == 'ServiceReef':
             # ServiceReef uses client credentials flow
@@ -43,9 +243,20 @@ class TokenService:
                 )
             
             # Set up token file path
-            token_dir = Path.home() / '.tokens'
-            token_dir.mkdir(exist_ok=True)
-            self.token_file = token_dir / 'servicereef_token.json'
+            SR_TOKEN_DIR.mkdir(exist_ok=True)
+            self.token_file = SR_TOKEN_DIR / 'servicereef_token.json'
+            
+            # Client credentials token request body; the credentials never change
+            self._token_body = {
+                'grant_type': 'client_credentials',
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            }
+            self._refresh_body = {
+                'grant_type': 'refresh_token',
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            }
             
         elif service_type == 'NXT':
             # NXT uses OAuth2 authorization code flow with refresh tokens
@@ -54,6 +265,9 @@ class TokenService:
             self.token_endpoint = 'https://oauth2.sky.blackbaud.com/token'
             self.auth_endpoint = 'https://oauth2.sky.blackbaud.com/authorization'
             self.redirect_uri = os.getenv('NXT_REDIRECT_URI')
+            # Fallback tokens from the environment, read once rather than on every token fetch
+            self.env_access_token = os.getenv('NXT_ACCESS_TOKEN')
+            self.env_refresh_token = os.getenv('NXT_REFRESH_TOKEN')
             
             if not all([self.client_id, self.client_secret]):
                 raise ValueError(
@@ -61,17 +275,24 @@ class TokenService:
                 )
             
             # Set up token file path for NXT - use same path as PHP implementation
-            base_dir = Path(__file__).parent.parent
-            token_dir = base_dir / 'ServiceReefAPI' / 'tokens'
-            token_dir.mkdir(exist_ok=True)
-            self.token_file = token_dir / 'blackbaud_token.json'
+            NXT_TOKEN_DIR.mkdir(exist_ok=True)
+            self.token_file = NXT_TOKEN_DIR / 'blackbaud_token.json'
+            
+            # Constant fields of the refresh request; only the refresh token varies
+            self._refresh_body = {
+                'grant_type': 'refresh_token',
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            }
+            if self.redirect_uri:
+                self._refresh_body['redirect_uri'] = self.redirect_uri
             
             # Load existing token or use environment variable
             token_data = self._load_token_from_file()
             if not token_data:
                 # If no token file, try environment variable
-                access_token = os.getenv('NXT_ACCESS_TOKEN')
-                refresh_token = os.getenv('NXT_REFRESH_TOKEN')
+                access_token = self.env_access_token
+                refresh_token = self.env_refresh_token
                 if access_token:
                     token_data = {
                         'access_token': access_token,
@@ -92,88 +313,94 @@ class TokenService:
             self.nxt_base_url = os.getenv('NXT_BASE_URL', 'https://api.sky.blackbaud.com')
         else:
             raise ValueError(f"Unknown service type: {service_type}")
-        self.token_file.parent.mkdir(exist_ok=True)
 
     def get_valid_access_token(self):
         """Get a valid access token, refreshing if necessary."""
-        token_data = self._load_token_from_file()
-        if token_data and 'access_token' in token_data:
-            if self.service_type == 'NXT':
-                # Check if token exists and has required fields
-                if not all(k in token_data for k in ['access_token', 'fetched_at', 'expires_in']):
-                    self.logger.error("Invalid token data: missing required fields")
-                    return self._handle_invalid_token()
+        # Fast path: token cached in memory and not close to expiry
+        if time.monotonic() < self._cached_expiry:
+            return self._cached_token
+        
+        # Serialize token checks/refreshes across worker threads
+        with self._lock:
+            if time.monotonic() < self._cached_expiry:
+                return self._cached_token
+            
+            token_data = self._load_token_from_file()
+            if token_data and 'access_token' in token_data:
+                if self.service_type == 'NXT':
+                    # Check if token exists and has required fields
+                    if not all(k in token_data for k in ['access_token', 'fetched_at', 'expires_in']):
+                        self.logger.error("Invalid token data: missing required fields")
+                        return self._handle_invalid_token()
                 
-                try:
-                    # Check if token is expired
-                    fetched_at = float(token_data['fetched_at'])
-                    expires_in = int(token_data['expires_in'])
-                    current_time = time.time()
+                    try:
+                        # Check if token is expired
+                        fetched_at = float(token_data['fetched_at'])
+                        expires_in = int(token_data['expires_in'])
+                        current_time = time.time()
                     
-                    # Calculate time until expiry
-                    time_until_expiry = (fetched_at + expires_in) - current_time
+                        # Calculate time until expiry
+                        time_until_expiry = (fetched_at + expires_in) - current_time
                     
-                    # Log token timing info
-                    self.logger.info(
-                        f"Token status - Fetched: {fetched_at}, "
-                        f"Expires in: {expires_in}, "
-                        f"Time until expiry: {time_until_expiry:.0f} seconds"
-                    )
+                        # Log token timing info
+                        self.logger.info(
+                            f"Token status - Fetched: {fetched_at}, "
+                            f"Expires in: {expires_in}, "
+                            f"Time until expiry: {time_until_expiry:.0f} seconds"
+                        )
                     
-                    # If token expires in more than 2 minutes, use it
-                    if time_until_expiry > 120:
-                        self.logger.info("Using existing NXT token")
-                        return token_data['access_token']
+                        # If token expires in more than 2 minutes, use it
+                        if time_until_expiry > 120:
+                            self.logger.info("Using existing NXT token")
+                            self._cache_token(token_data)
+                            return token_data['access_token']
                         
-                    # Token is expired or expiring soon, try to refresh
-                    self.logger.info("NXT token expired or expiring soon")
+                        # Token is expired or expiring soon, try to refresh
+                        self.logger.info("NXT token expired or expiring soon")
                     
-                    # First try refresh token if available
-                    if 'refresh_token' in token_data:
-                        self.logger.info("Attempting to refresh token")
-                        new_token_data = self._refresh_token(token_data['refresh_token'])
+                        # First try refresh token if available
+                        if 'refresh_token' in token_data:
+                            self.logger.info("Attempting to refresh token")
+                            new_token_data = self._refresh_token(token_data['refresh_token'])
                         
-                        if new_token_data and 'access_token' in new_token_data:
-                            return new_token_data['access_token']
-                    else:
-                        self.logger.warning("No refresh token available")
+                            if new_token_data and 'access_token' in new_token_data:
+                                return new_token_data['access_token']
+                        else:
+                            self.logger.warning("No refresh token available")
                     
-                    # If we get here, refresh failed or no refresh token
-                    return self._handle_invalid_token()
+                        # If we get here, refresh failed or no refresh token
+                        return self._handle_invalid_token()
                     
-                except (ValueError, TypeError) as e:
-                    self.logger.error(f"Error parsing token data: {str(e)}")
-                    return self._handle_invalid_token()
-            else:
-                # For ServiceReef, check expiry
-                expires_in = token_data.get('expires_in', 3600)
-                fetched_at = token_data.get('fetched_at', 0)
-                if time.time() - fetched_at > (expires_in - 120):
-                    self.logger.info("ServiceReef token expired, getting new token")
-                    return self._get_new_token()
-                self.logger.info("Using existing ServiceReef token")
-                return token_data['access_token']
+                    except (ValueError, TypeError) as e:
+                        self.logger.error(f"Error parsing token data: {str(e)}")
+                        return self._handle_invalid_token()
+                else:
+                    # For ServiceReef, check expiry
+                    expires_in = token_data.get('expires_in', 3600)
+                    fetched_at = token_data.get('fetched_at', 0)
+                    if time.time() - fetched_at > (expires_in - 120):
+                        self.logger.info("ServiceReef token expired, getting new token")
+                        return self._get_new_token()
+                    self.logger.info("Using existing ServiceReef token")
+                    self._cache_token(token_data)
+                    return token_data['access_token']
         
-        # Get new token if we get here
-        self.logger.info("No token found, getting new token")
-        return self._get_new_token()
+            # Get new token if we get here
+            self.logger.info("No token found, getting new token")
+            return self._get_new_token()
 
     def _get_new_token(self):
         """Get a new access token."""
         try:
             if self.service_type == 'ServiceReef':
                 # Use client credentials flow for ServiceReef
-                data = {
-                    'grant_type': 'client_credentials',
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret
-                }
+                data = self._token_body
             else:  # NXT
                 # For NXT, we need an authorization code first
                 # This should be obtained through the OAuth2 authorization flow
                 # and passed to this method
                 # For NXT, we need to use the access token from environment
-                access_token = os.getenv('NXT_ACCESS_TOKEN')
+                access_token = self.env_access_token
                 if not access_token:
                     raise ValueError(
                         'NXT_ACCESS_TOKEN not found in environment. You must first:\n'
@@ -193,7 +420,7 @@ class TokenService:
                 }
                 
                 # Add refresh token if available
-                refresh_token = os.getenv('NXT_REFRESH_TOKEN')
+                refresh_token = self.env_refresh_token
                 if refresh_token:
                     token_data['refresh_token'] = refresh_token
                 
@@ -202,10 +429,10 @@ class TokenService:
                 return access_token
             
             # Make the request
-            response = requests.post(self.token_endpoint, data=data)
+            response = self.session.post(self.token_endpoint, data=data, timeout=REQUEST_TIMEOUT)
             
             if response.ok:
-                token_data = response.json()
+                token_data = orjson.loads(response.content)
                 token_data['fetched_at'] = time.time()
                 
                 # Save the token data
@@ -271,15 +498,15 @@ class TokenService:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.token_endpoint,
                 data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                timeout=REQUEST_TIMEOUT
             )
             
             response.raise_for_status()
             
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             if 'access_token' not in token_data:
                 raise ValueError('No access token in response')
                 
@@ -311,6 +538,9 @@ class TokenService:
         if self.service_type != 'NXT':
             raise ValueError('_handle_invalid_token is only valid for NXT service type')
         
+        # The cached token has been rejected, don't hand it out again
+        self._cached_expiry = 0.0
+        
         # Try to refresh using token from file
         token_data = self._load_token_from_file()
         if token_data and 'refresh_token' in token_data:
@@ -353,22 +583,13 @@ class TokenService:
             self.logger.error("No refresh token provided")
             return None
             
-        data = {
-            'grant_type': 'refresh_token',
-            'refresh_token': refresh_token,
-            'client_id': self.client_id,
-            'client_secret': self.client_secret
-        }
-        
-        # Add redirect_uri for NXT
-        if self.service_type == 'NXT' and self.redirect_uri:
-            data['redirect_uri'] = self.redirect_uri
+        data = dict(self._refresh_body, refresh_token=refresh_token)
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.token_endpoint,
                 data=data,
-                headers={'Content-Type': 'application/x-www-form-urlencoded'}
+                timeout=REQUEST_TIMEOUT
             )
             
             # Log response status (but not content, as it may contain sensitive data)
@@ -384,7 +605,7 @@ class TokenService:
             
             response.raise_for_status()
             
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             if not token_data or 'access_token' not in token_data:
                 self.logger.error("Invalid response: no access token found")
                 return None
@@ -407,10 +628,75 @@ class TokenService:
             self.logger.error(f"Error refreshing token: {str(e)}")
             return None
 
+    def _cache_token(self, token_data):
+        """Keep token data in memory until two minutes before it expires.
+        
+        Args:
+            token_data: Dict containing access_token, expires_in and fetched_at
+        """
+        try:
+            expires_in = float(token_data.get('expires_in', 3600))
+            fetched_at = float(token_data.get('fetched_at', time.time()))
+        except (ValueError, TypeError):
+            return
+        remaining = fetched_at + expires_in - time.time() - 120
+        self._cached_token = token_data['access_token']
+        self._cached_expiry = time.monotonic() + remaining
+        self._schedule_refresh(remaining - 180)
+        
+    def _schedule_refresh(self, delay):
+        """Renew the token in the background five minutes before it expires.
+        
+        Requests keep using the cached token meanwhile, so they never wait on the
+        token endpoint; the inline refresh in get_valid_access_token remains as
+        the fallback if the background renewal fails.
+        
+        Args:
+            delay: Seconds until the renewal should run
+        """
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if delay <= 0:
+            return
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+        
+    def _background_refresh(self):
+        """Fetch a new token ahead of expiry; failures are left to the inline path."""
+        try:
+            with self._lock:
+                if self.service_type == 'NXT':
+                    refresh_token = (self._load_token_from_file() or {}).get('refresh_token')
+                    if not refresh_token:
+                        return
+                    self._refresh_token(refresh_token)
+                else:
+                    self._get_new_token()
+        except Exception as e:
+            self.logger.warning(f"Background token refresh failed: {str(e)}")
+            
+    def close(self):
+        """Stop the background token renewal."""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+            
     def _load_token_from_file(self):
         try:
-            if self.token_file and self.token_file.exists():
-                token_data = json.loads(self.token_file.read_text())
+            if self.token_file:
+                try:
+                    st = self.token_file.stat()
+                except FileNotFoundError:
+                    return None
+                # Reuse the parsed data unless the file has been rewritten
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamp == self._token_file_stamp:
+                    return self._token_data
+                token_data = orjson.loads(self.token_file.read_bytes())
+                self._token_data = token_data
+                self._token_file_stamp = stamp
                 self.logger.info(f"Loaded token data from {self.token_file}")
                 return token_data
         except Exception as e:
@@ -439,12 +725,11 @@ class TokenService:
                         token_data['refresh_token'] = existing_data['refresh_token']
                         self.logger.info('Preserved existing refresh token')
             
-            # Create directory if it doesn't exist
-            self.token_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write token data to file
-            with open(self.token_file, 'w') as f:
-                json.dump(token_data, f)
+            # Write token data to file; __init__ already created the token directory.
+            # Replace the file atomically so a crash mid-write never leaves a
+            # truncated token that forces a new OAuth round-trip on every call
+            _atomic_write_bytes(self.token_file, orjson.dumps(token_data))
+            self._cache_token(token_data)
                 
             self.logger.info(f"Saved token data to {self.token_file}")
             
@@ -453,6 +738,47 @@ class TokenService:
 
 
 class EventSyncService:
+    # Normalized ServiceReef registration status -> NXT RSVP status.
+    # Per user requirements "declined"/"cancelled" map to "Declined",
+    # "registered"/"approved" map to "Attending", and "waitingapproval"
+    # maps to "Attending" per client clarification.
+    RSVP_STATUS_MAPPING = {
+        'approved': 'Attending',
+        'registered': 'Attending',
+        'waitingapproval': 'Attending',
+        'declined': 'Declined',
+        'cancelled': 'Declined',
+        'draft': 'Declined',
+    }
+    
+    # ServiceReef member fields read when creating or updating NXT constituents
+    MEMBER_DETAIL_FIELDS = ('FirstName', 'LastName', 'MiddleName', 'Prefix', 'Suffix', 'Email', 'Phone', 'Address')
+    
+    # Member fields a participant payload must carry with values before it can stand
+    # in for the /v1/members lookup; the listing may return them blank
+    REQUIRED_MEMBER_FIELDS = ('Email', 'FirstName', 'LastName')
+    
+    # (ServiceReef field, NXT constituent field, NXT update payload field) for name updates
+    NAME_FIELD_MAP = (
+        ('FirstName', 'first', 'first_name'),
+        ('LastName', 'last', 'last_name'),
+        ('MiddleName', 'middle', 'middle_name'),
+        ('Suffix', 'suffix', 'suffix'),
+        ('Prefix', 'prefix', 'prefix'),
+    )
+    
+    # Fixed attribute set; avoids a per-instance __dict__ on the request hot path
+    __slots__ = (
+        'logger', 'event_mapping_file', 'constituent_mapping_file',
+        'event_mapping_log_file', 'constituent_mapping_log_file', '_event_mapping_log', '_mapping_log',
+        'max_workers', '_mapping_lock', '_event_mapping_lock', 'sr_session', 'nxt_session',
+        'sr_token_service', 'nxt_token_service', 'nxt_subscription_key', 'sr_base_url', 'nxt_base_url', '_nxt_headers',
+        'event_mapping', 'participant_mapping', 'constituent_mapping', 'constituent_cache', '_constituent_locks',
+        'constituent_hash_file', 'constituent_hashes', '_constituent_hashes_dirty', 'nxt_email_index',
+        'nxt_email_matches', '_email_index_failed',
+        '_email_index_lock', 'nxt_event_participants', '_participants_lock', '_event_participants_locks', '_nxt_executor', 'member_details_cache', 'page_size', 'retry_delay', 'max_retries'
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger('EventSync')
         
@@ -461,10 +787,49 @@ class EventSyncService:
         self.event_mapping_file = base_dir / 'data' / 'event_mapping.json'
         self.constituent_mapping_file = base_dir / 'data' / 'constituent_mapping.json'
         
+        # Append-only logs of mapping changes, merged into the JSON files by compact()
+        self.event_mapping_log_file = base_dir / 'data' / 'event_mapping.ndjson'
+        self.constituent_mapping_log_file = base_dir / 'data' / 'constituent_mapping.ndjson'
+        
+        # Digest of the member details last pushed to each NXT constituent
+        self.constituent_hash_file = base_dir / 'data' / 'constituent_hashes.json'
+        self._constituent_hashes_dirty = False
+        self._event_mapping_log = None
+        self._mapping_log = None
+        
         # Ensure data directory exists
         self.event_mapping_file.parent.mkdir(exist_ok=True)
         
-        # Initialize token services
+        # Number of concurrent workers used for event/participant sync. Each worker
+        # keeps its own pooled keep-alive connection, so this bounds in-flight requests.
+        sync_max_workers = os.getenv('SYNC_MAX_WORKERS', '8')
+        try:
+            max_workers = int(sync_max_workers)
+        except ValueError:
+            raise ValueError(f'SYNC_MAX_WORKERS must be a whole number, got {sync_max_workers!r}') from None
+        if not 1 <= max_workers <= MAX_SYNC_WORKERS:
+            self.logger.warning(f"SYNC_MAX_WORKERS={max_workers} is outside 1-{MAX_SYNC_WORKERS}, clamping")
+            max_workers = min(max(1, max_workers), MAX_SYNC_WORKERS)
+        self.max_workers = max_workers
+        
+        # NXT lookups fanned out from inside the event and participant pools
+        # (participant listing pages, batch email searches) share one bounded
+        # executor instead of each opening another nested pool
+        self._nxt_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        # Guards mapping updates made from worker threads
+        self._mapping_lock = threading.Lock()
+        self._event_mapping_lock = threading.Lock()
+        self._constituent_locks = {}
+        self._participants_lock = threading.Lock()
+        self._event_participants_locks = {}
+        
+        # Persistent HTTP sessions so connections are reused across calls
+        self.sr_session = self._create_session()
+        self.nxt_session = self._create_session()
+        
+        # Initialize token services. Token requests are form-encoded, so the token
+        # service gets its own session rather than the API session's JSON defaults.
         self.sr_token_service = TokenService('ServiceReef')
         
         # Get NXT subscription key
@@ -472,60 +837,228 @@ class EventSyncService:
         if not self.nxt_subscription_key:
             raise ValueError('NXT_SUBSCRIPTION_KEY is required')
             
-        # Get base URLs
-        self.sr_base_url = os.getenv('SERVICE_REEF_BASE_URL')
-        self.nxt_base_url = os.getenv('NXT_BASE_URL', 'https://api.sky.blackbaud.com')
+        # Headers that never change are set once on the sessions; requests only add Authorization
+        self.sr_session.headers['Content-Type'] = 'application/json'
+        self.nxt_session.headers.update({
+            'Content-Type': 'application/json',
+            'Bb-Api-Subscription-Key': self.nxt_subscription_key
+        })
+        
+        # (access token, per-request headers) last built by _prepare_nxt_headers
+        self._nxt_headers = (None, None)
+        
+        # Get base URLs, resolved once and used as plain prefixes for every request
+        self.sr_base_url = (os.getenv('SERVICE_REEF_BASE_URL') or '').rstrip('/')
+        self.nxt_base_url = os.getenv('NXT_BASE_URL', 'https://api.sky.blackbaud.com').rstrip('/')
         
         # Initialize mappings
         self.event_mapping = {}
         self.participant_mapping = {}
         
+        # Email -> NXT constituent ID for every NXT constituent, built by
+        # _prime_constituent_index() when there is no constituent mapping to work
+        # from; a failed listing is recorded so it isn't attempted again
+        self.nxt_email_index = None
+        self._email_index_failed = False
+        # Email -> NXT constituent ID (None when NXT has no match) from the email
+        # searches and constituent creations made during this run
+        self.nxt_email_matches = {}
+        self._email_index_lock = threading.Lock()
+        
+        # NXT participants per NXT event ID, fetched once per run and kept
+        # current as participants are added
+        self.nxt_event_participants = {}
+        
         # Load existing mappings if available
         self._load_mappings()
+        self._event_mapping_log = open(self.event_mapping_log_file, 'ab', buffering=1 << 16)
+        self._mapping_log = open(self.constituent_mapping_log_file, 'ab', buffering=1 << 16)
         
-        # Service configuration
+        # Service configuration. ServiceReef listings are requested in pages of
+        # page_size so every response body stays small enough to parse in one go.
         self.page_size = 100
         self.retry_delay = 2
         self.max_retries = 3
         
-        # Initialize NXT token service
+        # Initialize NXT token service. The OAuth endpoint is a different host from the
+        # API, so it gets its own session rather than the API session's subscription key.
         self.nxt_token_service = TokenService('NXT')
-        
-        # Additional NXT-specific settings
-        self.nxt_base_url = os.getenv('NXT_BASE_URL', 'https://api.sky.blackbaud.com')
 
+    def _create_session(self):
+        """Create an HTTP session with a keep-alive connection pool.
+        
+        Returns:
+            requests.Session: Session with a pooled HTTPS adapter mounted
+        """
+        session = requests.Session()
+        # Retry throttling and transient server errors on the pooled connection with
+        # exponential backoff (honouring Retry-After). This is the only layer that
+        # retries them; callers don't loop on these statuses. POST is left out so a
+        # retried create can never register a constituent or participant twice.
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'PATCH', 'PUT', 'DELETE']),
+            raise_on_status=False
+        )
+        # Event and participant syncs both fan out, so size the pool for nested workers
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(20, self.max_workers * self.max_workers),
+            max_retries=retries
+        )
+        session.mount('https://', adapter)
+        return session
+        
+    def close(self):
+        """Release pooled HTTP connections and the mapping log files.
+        
+        Safe to call more than once; later calls do nothing.
+        """
+        with self._event_mapping_lock:
+            if self._event_mapping_log is None:
+                return
+            self._event_mapping_log.close()
+            self._event_mapping_log = None
+        with self._mapping_lock:
+            self._mapping_log.close()
+            self._mapping_log = None
+            
+        self.sr_session.close()
+        self.nxt_session.close()
+        self.sr_token_service.close()
+        self.nxt_token_service.close()
+        self.sr_token_service.session.close()
+        self.nxt_token_service.session.close()
+        self._nxt_executor.shutdown(wait=False)
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, tb):
+        # Persist logged mapping changes before dropping the connections
+        self.compact()
+        self.close()
+        
     def _load_mappings(self):
         """Load event and constituent mappings from files.
         Creates new mapping files if they don't exist.
         """
+        # Make sure buffered log entries are on disk before replaying them
+        for mapping_log in (self._event_mapping_log, self._mapping_log):
+            if mapping_log:
+                mapping_log.flush()
+        
         # Load event mapping
         if self.event_mapping_file.exists():
-            self.event_mapping = json.loads(self.event_mapping_file.read_text())
-            # Ensure all keys and values are strings
-            self.event_mapping = {str(k): str(v) if v is not None else None for k, v in self.event_mapping.items()}
+            self.event_mapping = orjson.loads(self.event_mapping_file.read_bytes())
+            self._replay_mapping_log(self.event_mapping_log_file, self.event_mapping)
+            # Ensure all keys and values are (interned) strings
+            self.event_mapping = _intern_mapping(self.event_mapping)
         else:
             self.event_mapping = {}
-            self.event_mapping_file.write_text(json.dumps(self.event_mapping))
+            # Entries appended before the mapping file was ever written still count
+            self._replay_mapping_log(self.event_mapping_log_file, self.event_mapping)
+            _atomic_write_bytes(self.event_mapping_file, orjson.dumps(self.event_mapping))
         
         # Load constituent mapping
         self.logger.info(f"Checking constituent mapping file at: {self.constituent_mapping_file}")
         if self.constituent_mapping_file.exists():
             self.logger.info("Loading existing constituent mapping file")
-            self.constituent_mapping = json.loads(self.constituent_mapping_file.read_text())
-            # Ensure all keys and values are strings
-            self.constituent_mapping = {str(k): str(v) if v is not None else None for k, v in self.constituent_mapping.items()}
+            self.constituent_mapping = orjson.loads(self.constituent_mapping_file.read_bytes())
+            self._replay_mapping_log(self.constituent_mapping_log_file, self.constituent_mapping)
+            # Ensure all keys and values are (interned) strings
+            self.constituent_mapping = _intern_mapping(self.constituent_mapping)
             self.logger.debug(f"Loaded {len(self.constituent_mapping)} constituent mappings")
         else:
             self.logger.info("Creating new constituent mapping file")
             self.constituent_mapping = {}
-            self.constituent_mapping_file.write_text(json.dumps(self.constituent_mapping))
+            self._replay_mapping_log(self.constituent_mapping_log_file, self.constituent_mapping)
+            _atomic_write_bytes(self.constituent_mapping_file, orjson.dumps(self.constituent_mapping))
         
+        # NXT constituent IDs resolved (verified or created) during this run
         self.constituent_cache = {}
         
+        # ServiceReef member details fetched during this run, keyed by member ID
+        self.member_details_cache = {}
+        
+        # Load member detail digests used to skip unchanged constituent updates
+        if self.constituent_hash_file.exists():
+            self.constituent_hashes = orjson.loads(self.constituent_hash_file.read_bytes())
+        else:
+            self.constituent_hashes = {}
+        
+    def _replay_mapping_log(self, log_file, mapping):
+        """Apply entries from an append-only mapping log to a loaded mapping.
+        
+        Args:
+            log_file: Path to the NDJSON log, one {service_reef_id: nxt_id} object per line
+            mapping: Dict to update in place
+        """
+        if not log_file.exists():
+            return
+        with open(log_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    mapping.update(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    # A crash mid-write can leave a partial last line
+                    self.logger.warning(f"Skipping malformed line in {log_file}")
+        
+    def _set_constituent_mapping(self, service_reef_id, nxt_id):
+        """Record a ServiceReef to NXT constituent mapping.
+        
+        The change is appended to the constituent mapping log rather than
+        rewriting the whole mapping file; compact() merges it back.
+        
+        Args:
+            service_reef_id: ServiceReef member ID
+            nxt_id: NXT constituent ID
+        """
+        with self._mapping_lock:
+            service_reef_id = str(service_reef_id)
+            self.constituent_mapping[service_reef_id] = nxt_id
+            self._mapping_log.write(orjson.dumps({service_reef_id: nxt_id}) + b'\n')
+            
+    def compact(self):
+        """Merge the mapping logs into the mapping files and truncate the logs.
+        
+        A mapping whose log is empty has not changed since the last compaction,
+        so its file is left untouched. Once close() has run there is nothing
+        left to compact; the next run replays the closed logs instead.
+        """
+        with self._event_mapping_lock:
+            if self._event_mapping_log is None:
+                return
+            if self._event_mapping_log.tell():
+                self._event_mapping_log.flush()
+                self._save_mapping(self.event_mapping_file, self.event_mapping)
+                self._event_mapping_log.seek(0)
+                self._event_mapping_log.truncate()
+        with self._mapping_lock:
+            if self._mapping_log.tell():
+                self._mapping_log.flush()
+                self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
+                self._mapping_log.seek(0)
+                self._mapping_log.truncate()
+            if self._constituent_hashes_dirty:
+                self._save_mapping(self.constituent_hash_file, self.constituent_hashes)
+                self._constituent_hashes_dirty = False
+    
+    def checkpoint(self):
+        """Flush buffered mapping log entries to disk without compacting."""
+        with self._event_mapping_lock:
+            self._event_mapping_log.flush()
+        with self._mapping_lock:
+            self._mapping_log.flush()
+            
     def _save_mapping(self, mapping_file, mapping_data):
         """Save mapping data to a file"""
         try:
-            mapping_file.write_text(json.dumps(mapping_data, indent=2))
+            _atomic_write_bytes(mapping_file, orjson.dumps(mapping_data))
             self.logger.info(f"Saved mapping to {mapping_file}")
         except Exception as e:
             self.logger.error(f"Error saving mapping to {mapping_file}: {str(e)}")
@@ -535,41 +1068,32 @@ class EventSyncService:
         """Redact sensitive information from headers before logging."""
         redacted = headers.copy()
         sensitive_keys = ['Authorization', 'Bb-Api-Subscription-Key']
-        # Load mappings
-        self._load_mappings()
-        
-        # Service configuration
-        self.service_reef_base_url = os.getenv('SERVICE_REEF_BASE_URL')
-        self.nxt_base_url = os.getenv('NXT_BASE_URL', 'https://api.sky.blackbaud.com')
-        self.page_size = 100
-        self.retry_delay = 2
-        self.max_retries = 3
-        
-        # Initialize token services
-        self.sr_token_service = TokenService('ServiceReef')
+        for key in sensitive_keys:
+            if key in redacted:
+                redacted[key] = '[REDACTED]'
+        return redacted
         
     def _prepare_nxt_headers(self, access_token):
         """Prepare headers for NXT API requests.
         
+        The headers only change when the token does, so they are built once per
+        token and shared by every request made with it; callers must not mutate them.
+        
         Args:
             access_token: Valid OAuth2 access token
             
         Returns:
-            dict: Headers required for NXT API requests
+            dict: Per-request headers; the subscription key and content type are
+                  session defaults
         """
-        return {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json',
-            'Bb-Api-Subscription-Key': self.nxt_subscription_key
-        }
+        # Read the pair once; worker threads may swap in a new token concurrently
+        cached_token, headers = self._nxt_headers
+        if cached_token != access_token:
+            headers = {'Authorization': f'Bearer {access_token}'}
+            self._nxt_headers = (access_token, headers)
+        return headers
 
-    def _handle_nxt_request(self, method, endpoint, json_data=None, params=None, retry_count=0):
-        # Debug API calls
-        print(f"NXT API CALL: {method} {endpoint}")
-        if json_data:
-            print(f"PAYLOAD: {json.dumps(json_data, indent=2)}")
-        if params:
-            print(f"PARAMS: {params}")
+    def _handle_nxt_request(self, method, endpoint, json_data=None, params=None, retry_count=0, raise_for_status=False):
         """Handle a request to the NXT API.
         
         Args:
@@ -578,9 +1102,14 @@ class EventSyncService:
             json_data: Optional JSON data to send
             params: Optional query parameters
             retry_count: Number of retries attempted (internal use)
+            raise_for_status: If True, raise NxtApiError for error responses
+                              instead of returning the error body
             
         Returns:
             dict: Response JSON if successful, None if failed
+            
+        Raises:
+            NxtApiError: On an error response when raise_for_status is set
         """
         try:
             # Get valid access token
@@ -593,147 +1122,84 @@ class EventSyncService:
             headers = self._prepare_nxt_headers(access_token)
             
             # Make request
-            url = f"{self.nxt_base_url}{endpoint}"
-            
-            # Enhanced debugging for API calls
-            if '/participants/' in endpoint or 'rsvp_status' in str(json_data):
-                # Add special debug tags for RSVP-related calls
-                self.logger.info(f"[API_DEBUG] ==== NXT API CALL ====")
-                self.logger.info(f"[API_DEBUG] Method: {method}")
-                self.logger.info(f"[API_DEBUG] URL: {url}")
-                self.logger.info(f"[API_DEBUG] Headers: {self._redact_headers(headers)}")
-                if json_data:
-                    self.logger.info(f"[API_DEBUG] Request data: {json.dumps(json_data, indent=2)}")
-                if params:
-                    self.logger.info(f"[API_DEBUG] Query params: {json.dumps(params, indent=2)}")
-            else:
-                # Regular debug logging for other API calls
-                self.logger.debug(f"{method} {url}")
-                self.logger.debug(f"Headers: {self._redact_headers(headers)}")
+            url = self.nxt_base_url + endpoint
+            
+            # RSVP-related calls are traced at INFO with an [API_DEBUG] tag, everything
+            # else at DEBUG. Check the level once so disabled traces skip the header
+            # copy and JSON dumps. RSVP payloads carry rsvp_status as a top-level key,
+            # so test the dict rather than stringifying the whole payload.
+            rsvp_call = '/participants/' in endpoint or (isinstance(json_data, dict) and 'rsvp_status' in json_data)
+            log_level = logging.INFO if rsvp_call else logging.DEBUG
+            log_prefix = "[API_DEBUG] " if rsvp_call else ""
+            trace = self.logger.isEnabledFor(log_level)
+            
+            if trace:
+                self.logger.log(log_level, f"{log_prefix}{method} {url}")
+                self.logger.log(log_level, f"{log_prefix}Headers: {self._redact_headers(headers)}")
                 if json_data:
-                    self.logger.debug(f"Request data: {json.dumps(json_data, indent=2)}")
+                    self.logger.log(log_level, f"{log_prefix}Request data: {_compact_json(json_data)}")
                 if params:
-                    self.logger.debug(f"Query params: {json.dumps(params, indent=2)}")
+                    self.logger.log(log_level, f"{log_prefix}Query params: {_compact_json(params)}")
                 
-            response = requests.request(method, url, headers=headers, json=json_data, params=params)
+            # Encode the body with orjson; headers already carry the JSON content type
+            body = orjson.dumps(json_data) if json_data is not None else None
+            response = self.nxt_session.request(method, url, headers=headers, data=body, params=params, timeout=REQUEST_TIMEOUT)
             
             # Handle response
             if response.ok:
-                # Enhanced debugging for RSVP-related responses
-                if '/participants/' in endpoint or 'rsvp_status' in str(json_data):
-                    self.logger.info(f"[API_DEBUG] Response status code: {response.status_code}")
-                    self.logger.info(f"[API_DEBUG] Response headers: {dict(response.headers)}")
-                    if response.content:
-                        try:
-                            json_response = response.json()
-                            self.logger.info(f"[API_DEBUG] Response JSON: {json.dumps(json_response, indent=2)}")
-                            return json_response
-                        except json.JSONDecodeError:
-                            self.logger.info(f"[API_DEBUG] Response content (not JSON): {response.text}")
-                            return response
-                    self.logger.info(f"[API_DEBUG] Empty response content with status code {response.status_code}")
+                if trace:
+                    self.logger.log(log_level, f"{log_prefix}Response status code: {response.status_code}")
+                    self.logger.log(log_level, f"{log_prefix}Response headers: {dict(response.headers)}")
+                if not response.content:
+                    if trace:
+                        self.logger.log(log_level, f"{log_prefix}Empty response content with status code {response.status_code}")
                     return response
-                else:
-                    # Regular debug logging for other responses
-                    self.logger.debug(f"Response status code: {response.status_code}")
-                    self.logger.debug(f"Response headers: {response.headers}")
-                    if response.content:
-                        try:
-                            json_response = response.json()
-                            self.logger.debug(f"Response JSON: {json.dumps(json_response, indent=2)}")
-                            return json_response
-                        except json.JSONDecodeError:
-                            self.logger.debug(f"Response content (not JSON): {response.text}")
-                            return response
-                    self.logger.debug(f"Empty response content with status code {response.status_code}")
+                try:
+                    json_response = orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    if trace:
+                        self.logger.log(log_level, f"{log_prefix}Response content (not JSON): {response.text}")
                     return response
+                if trace:
+                    # Log the body as received rather than re-serializing the parsed data
+                    self.logger.log(log_level, f"{log_prefix}Response JSON ({len(response.content)} bytes): {response.content.decode(errors='replace')}")
+                return json_response
                 
             # Handle specific error cases
             if response.status_code == 401 and retry_count < self.max_retries:
                 self.logger.warning("Got 401, attempting to refresh token...")
                 # Force token refresh on next attempt
                 self.nxt_token_service._handle_invalid_token()
-                return self._handle_nxt_request(method, endpoint, json_data=json_data, params=params, retry_count=retry_count + 1)
+                # Back off before retrying so repeated rejections don't hammer the
+                # token endpoint and API in a tight loop
+                time.sleep(_backoff_delay(self.retry_delay, retry_count, response.headers.get('Retry-After')))
+                return self._handle_nxt_request(method, endpoint, json_data=json_data, params=params,
+                                                retry_count=retry_count + 1, raise_for_status=raise_for_status)
             
-            # Enhanced error logging for RSVP-related errors
+            # Error logging carries the same tag as the trace for RSVP-related calls
             error_text = response.text
-            error_prefix = "[API_DEBUG] " if '/participants/' in endpoint or 'rsvp_status' in str(json_data) else ""
             
-            self.logger.error(f"{error_prefix}NXT API error: {response.status_code}")
-            self.logger.error(f"{error_prefix}Error response: {error_text}")
-            self.logger.error(f"{error_prefix}Request URL: {url}")
+            self.logger.error(f"{log_prefix}NXT API error: {response.status_code}")
+            self.logger.error(f"{log_prefix}Error response: {error_text}")
+            self.logger.error(f"{log_prefix}Request URL: {url}")
             if json_data:
-                self.logger.error(f"{error_prefix}Request payload: {json.dumps(json_data, indent=2)}")
-            
-            print(f"DETAILED ERROR: HTTP {response.status_code} - {error_text}")
+                self.logger.error(f"{log_prefix}Request payload: {_pretty_json(json_data)}")
             
             # Return the error response instead of None so we can analyze it
             try:
-                return response.json()
-            except:
-                return error_text
-            
+                error_body = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                error_body = error_text
+            if raise_for_status:
+                raise NxtApiError(response.status_code, error_body, response.headers.get('Retry-After'))
+            return error_body
+            
+        except NxtApiError:
+            raise
         except Exception as e:
             self.logger.error(f"Error in NXT request: {str(e)}")
             return None
 
-    def _get_nxt_event_participants(self, event_id):
-        """Get all participants for an event from NXT, handling pagination.
-        
-        Args:
-            event_id: The NXT event ID
-            
-        Returns:
-            list: List of all participant data if successful, None if failed
-        """
-        try:
-            all_participants = []
-            page = 1
-            offset = 0
-            limit = 100
-            
-            while True:
-                self.logger.debug(f"Requesting participants for NXT event ID: {event_id}")
-                self.logger.debug(f"Requesting page {page} with params: {{'limit': {limit}, 'offset': {offset}}}")
-                
-                # Get participants for current page using limit and offset parameters
-                params = {'limit': limit, 'offset': offset}
-                endpoint = f"/event/v1/events/{event_id}/participants"
-                response = self._handle_nxt_request('GET', endpoint, params=params)
-                
-                if not response:
-                    if page == 1:
-                        self.logger.error(f"Failed to get any participants for event {event_id}")
-                        return None
-                    else:
-                        # No more results but we have some already
-                        break
-                
-                # Add participants from this page
-                participants = response.get('value', [])
-                if not participants:
-                    self.logger.debug(f"No participants found on page {page}")
-                    break
-                    
-                self.logger.debug(f"Found {len(participants)} participants on page {page}")
-                all_participants.extend(participants)
-                
-                # Move to next page using offset
-                offset += limit
-                page += 1
-                
-                # Check if we've retrieved all participants
-                if len(participants) < limit:
-                    self.logger.debug("Reached last page of participants")
-                    break
-            
-            self.logger.info(f"Retrieved {len(all_participants)} total participants for event {event_id}")
-            return all_participants
-            
-        except Exception as e:
-            self.logger.error(f"Error getting all participants for event {event_id}: {str(e)}")
-            return None
-            
     def _create_nxt_participant(self, nxt_event_id, participant_data):
         """Create a participant in NXT.
         
@@ -749,19 +1215,30 @@ class EventSyncService:
         """
         try:
             self.logger.info(f'Creating NXT participant for event {nxt_event_id}')
-            self.logger.debug(f'Input ServiceReef participant data: {json.dumps(participant_data, indent=2)}')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f'Input ServiceReef participant data: {_pretty_json(participant_data)}')
             
             # Check if participant already exists in event
+            constituent_details = None
             constituent_id = participant_data.get('constituent_id')
             if not constituent_id:
                 raise ValueError("Missing required field 'constituent_id' in participant data")
                 
-            existing_participants = self._get_all_nxt_event_participants(nxt_event_id)
+            existing_participants = self._get_cached_nxt_event_participants(nxt_event_id)
             if existing_participants:
                 # Log all existing participants for debugging
                 self.logger.info(f"Found {len(existing_participants)} existing participants in event {nxt_event_id}")
-                for p in existing_participants:
-                    self.logger.debug(f"NXT participant data: {json.dumps(p, indent=2)}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for p in existing_participants:
+                        self.logger.debug(f"NXT participant data: {_pretty_json(p)}")
+                
+                # Match on the constituent ID first; it needs no constituent lookup
+                for participant in existing_participants:
+                    # Check both contact_id and constituent_id (API inconsistency)
+                    if (participant.get('contact_id') or participant.get('constituent_id')) == constituent_id:
+                        self.logger.info(f"Found constituent {constituent_id} by ID match in event {nxt_event_id}")
+                        self._update_nxt_participant_status(nxt_event_id, participant, participant_data)
+                        return participant
                 
                 # Get constituent details to get lookup_id mapping
                 constituent_details = self._get_nxt_constituent(constituent_id)
@@ -773,28 +1250,31 @@ class EventSyncService:
                     constituent_email = constituent_details.get('email', {}).get('address', '').lower().strip()
                     constituent_name = f"{constituent_details.get('first', '')} {constituent_details.get('last', '')}".lower().strip()
                     
-                    # Check if constituent is already a participant by matching lookup_id, email, or name
+                    # Check if constituent is already a participant by matching lookup_id, email, or name.
+                    # Each participant field is only normalized when the constituent has a value to
+                    # compare it with, and an empty lookup_id never matches another empty one.
+                    log_comparisons = self.logger.isEnabledFor(logging.DEBUG)
                     for participant in existing_participants:
                         # Try lookup_id match first (most reliable)
-                        participant_lookup_id = str(participant.get('lookup_id', '')).strip()
-                        self.logger.debug(f"Comparing lookup_ids: {participant_lookup_id} == {constituent_lookup_id}")
-                        if participant_lookup_id == constituent_lookup_id:
-                            self.logger.info(f"Found constituent {constituent_id} by lookup_id match in event {nxt_event_id}")
-                            # Check if RSVP status has changed and update if necessary
-                            self._update_nxt_participant_status(nxt_event_id, participant, participant_data)
-                            return participant
+                        if constituent_lookup_id:
+                            participant_lookup_id = str(participant.get('lookup_id', '')).strip()
+                            if log_comparisons:
+                                self.logger.debug(f"Comparing lookup_ids: {participant_lookup_id} == {constituent_lookup_id}")
+                            if participant_lookup_id == constituent_lookup_id:
+                                self.logger.info(f"Found constituent {constituent_id} by lookup_id match in event {nxt_event_id}")
+                                # Check if RSVP status has changed and update if necessary
+                                self._update_nxt_participant_status(nxt_event_id, participant, participant_data)
+                                return participant
                             
                         # Try email match
-                        participant_email = participant.get('email', '').lower().strip()
-                        if constituent_email and participant_email == constituent_email:
+                        if constituent_email and participant.get('email', '').lower().strip() == constituent_email:
                             self.logger.info(f"Found constituent {constituent_id} by email match in event {nxt_event_id}")
                             # Check if RSVP status has changed and update if necessary
                             self._update_nxt_participant_status(nxt_event_id, participant, participant_data)
                             return participant
                             
                         # Try name match as last resort
-                        participant_name = f"{participant.get('first_name', '')} {participant.get('last_name', '')}".lower().strip()
-                        if constituent_name and participant_name == constituent_name:
+                        if constituent_name and f"{participant.get('first_name', '')} {participant.get('last_name', '')}".lower().strip() == constituent_name:
                             self.logger.info(f"Found constituent {constituent_id} by name match in event {nxt_event_id}")
                             # Check if RSVP status has changed and update if necessary
                             self._update_nxt_participant_status(nxt_event_id, participant, participant_data)
@@ -805,41 +1285,61 @@ class EventSyncService:
             nxt_participant = participant_data
             
             # Log the payload we're about to send
-            self.logger.info(f'Using NXT participant payload: {json.dumps(nxt_participant, indent=2)}')
-
-            self.logger.info(f'Transformed NXT participant data: {json.dumps(nxt_participant, indent=2)}')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f'Using NXT participant payload: {_compact_json(nxt_participant)}')
 
-            # Add participant to NXT event with retry
+            # Add participant to NXT event, retrying only while a created participant
+            # has yet to show up in the listing. Throttling and server errors are
+            # retried by the session's adapter, not here.
             endpoint = f"/event/v1/events/{nxt_event_id}/participants"
             max_retries = 3
             retry_count = 0
             
             while retry_count < max_retries:
                 self.logger.info(f'Sending POST request to NXT endpoint: {endpoint}')
-                response = self._handle_nxt_request('POST', endpoint, json_data=nxt_participant)
+                try:
+                    response = self._handle_nxt_request('POST', endpoint, json_data=nxt_participant, raise_for_status=True)
+                except NxtApiError as e:
+                    if e.status_code != 409:
+                        self.logger.error(f"NXT rejected participant {constituent_id} for event {nxt_event_id}: {e.body}")
+                        return None
+                    # Already registered; the verification below picks up the existing record
+                    self.logger.info(f"Constituent {constituent_id} is already a participant in event {nxt_event_id}")
+                    response = e.body or True
                 
-                if response:
-                    # After creating participant, verify it exists in the event
-                    time.sleep(1)  # Brief delay to allow for eventual consistency
-                    updated_participants = self._get_all_nxt_event_participants(nxt_event_id)
-                    if updated_participants:
-                        for participant in updated_participants:
-                            # Check both contact_id and constituent_id (API inconsistency)
-                            participant_id = participant.get('contact_id') or participant.get('constituent_id')
-                            if participant_id == constituent_id:
-                                self.logger.info(f'Successfully verified participant {constituent_id} in event {nxt_event_id}')
-                                return participant
-                            
-                            # Additional check by lookup_id if available
-                            if participant.get('lookup_id') and constituent_details and participant.get('lookup_id') == constituent_details.get('lookup_id'):
-                                self.logger.info(f'Verified participant {constituent_id} by lookup_id match in event {nxt_event_id}')
-                                return participant
+                if not response:
+                    # The request itself failed; the adapter has already retried it
+                    break
                     
-                    self.logger.warning(f"Created participant but could not verify - will retry")
+                # After creating participant, verify it exists in the event
+                time.sleep(1)  # Brief delay to allow for eventual consistency
+                # Stream the listing so the remaining pages aren't fetched once it's found
+                try:
+                    for participant in self._iter_nxt_event_participants(nxt_event_id):
+                        # Check both contact_id and constituent_id (API inconsistency)
+                        participant_id = participant.get('contact_id') or participant.get('constituent_id')
+                        if participant_id == constituent_id:
+                            self.logger.info(f'Successfully verified participant {constituent_id} in event {nxt_event_id}')
+                            self._remember_nxt_event_participant(nxt_event_id, participant)
+                            return participant
                         
-                self.logger.warning(f"Attempt {retry_count + 1} failed, retrying...")
+                        # Additional check by lookup_id if available
+                        if participant.get('lookup_id') and constituent_details and participant.get('lookup_id') == constituent_details.get('lookup_id'):
+                            self.logger.info(f'Verified participant {constituent_id} by lookup_id match in event {nxt_event_id}')
+                            self._remember_nxt_event_participant(nxt_event_id, participant)
+                            return participant
+                except Exception as e:
+                    # The listing's requests were already retried by the adapter
+                    self.logger.error(f"Error getting NXT event participants: {str(e)}")
+                    break
+                
+                self.logger.warning(f"Created participant but could not verify - will retry")
+                
                 retry_count += 1
-                time.sleep(2)  # Wait 2 seconds between retries
+                if retry_count < max_retries:
+                    delay = _backoff_delay(self.retry_delay, retry_count - 1)
+                    self.logger.warning(f"Attempt {retry_count} failed, retrying in {delay:.1f}s...")
+                    time.sleep(delay)
             
             self.logger.error(f"Failed to add participant to NXT event {nxt_event_id} after all retries")
             return None
@@ -851,6 +1351,50 @@ class EventSyncService:
             self.logger.error(f"Error creating NXT participant: {str(e)}")
             raise
             
+    def _get_cached_nxt_event_participants(self, nxt_event_id):
+        """Get the participants of an NXT event, fetching them at most once per run.
+        
+        Args:
+            nxt_event_id: The NXT event ID
+            
+        Returns:
+            list: Snapshot of the event's participants, None if they could not be fetched
+        """
+        with self._participants_lock:
+            participants = self.nxt_event_participants.get(nxt_event_id)
+            if participants is not None:
+                return list(participants)
+            event_lock = self._event_participants_locks.setdefault(nxt_event_id, threading.Lock())
+            
+        # Serialize the listing per event only, so workers syncing other events
+        # aren't held up while this one is fetched
+        with event_lock:
+            with self._participants_lock:
+                participants = self.nxt_event_participants.get(nxt_event_id)
+                if participants is not None:
+                    return list(participants)
+                    
+            participants = self._get_all_nxt_event_participants(nxt_event_id)
+            if participants is None:
+                # Leave uncached so the next participant retries the fetch
+                return None
+                
+            with self._participants_lock:
+                self.nxt_event_participants[nxt_event_id] = participants
+                return list(participants)
+            
+    def _remember_nxt_event_participant(self, nxt_event_id, participant):
+        """Add a newly created participant to the cached participants of its event.
+        
+        Args:
+            nxt_event_id: The NXT event ID
+            participant: Participant data returned by NXT
+        """
+        with self._participants_lock:
+            participants = self.nxt_event_participants.get(nxt_event_id)
+            if participants is not None and participant not in participants:
+                participants.append(participant)
+                
     def _search_nxt_constituents_by_email(self, email):
         """Search for constituents in NXT by email address.
         
@@ -923,6 +1467,106 @@ class EventSyncService:
             self.logger.error(f"Error searching NXT constituents: {str(e)}")
             return []
             
+    def _prime_constituent_index(self, limit=500):
+        """Build an email index of all NXT constituents with paged list requests.
+        
+        Args:
+            limit: Number of constituents requested per page
+            
+        Returns:
+            bool: True if the index was built, False if listing failed
+        """
+        if self._email_index_failed:
+            return False
+            
+        email_index = {}
+        offset = 0
+        while True:
+            response = self._handle_nxt_request('GET', '/constituent/v1/constituents',
+                                                params={'limit': limit, 'offset': offset})
+            if not isinstance(response, dict) or 'value' not in response:
+                # Fall back to per-member searches rather than trust a partial index
+                self.logger.warning("Failed to list NXT constituents, searching per member instead")
+                self._email_index_failed = True
+                return False
+                
+            constituents = response['value']
+            for constituent in constituents:
+                address = (constituent.get('email') or {}).get('address')
+                if address:
+                    email_index.setdefault(address.lower(), constituent.get('id'))
+                    
+            if len(constituents) < limit:
+                break
+            offset += limit
+            
+        self.nxt_email_index = email_index
+        self.logger.info(f"Indexed {len(email_index)} NXT constituents by email")
+        return True
+        
+    def _bulk_resolve_constituents(self, participants):
+        """Search NXT for the emails of a batch's unmapped participants concurrently.
+        
+        The searches run on the shared NXT executor, so the per-participant sync
+        then resolves these members from nxt_email_matches instead of searching
+        one at a time.
+        
+        Args:
+            participants: List of participant dicts from ServiceReef
+        """
+        if self.nxt_email_index is not None:
+            return
+            
+        emails = set()
+        for participant in participants:
+            service_reef_id = _sr_user_id(participant)
+            email = participant.get('Email')
+            if service_reef_id and email and service_reef_id not in self.constituent_mapping:
+                emails.add(email.lower())
+        with self._email_index_lock:
+            emails.difference_update(self.nxt_email_matches)
+        if not emails:
+            return
+            
+        self.logger.info(f"Searching NXT for {len(emails)} unmapped participant emails")
+        list(self._nxt_executor.map(self._find_constituent_by_email, emails))
+        
+    def _find_constituent_by_email(self, email):
+        """Find the NXT constituent with an email address, searching at most once per run.
+        
+        Args:
+            email: Email address to look up
+            
+        Returns:
+            str: NXT constituent ID if found, None if NXT has no constituent with it
+        """
+        email_key = email.lower()
+        with self._email_index_lock:
+            if self.nxt_email_index is not None:
+                # The primed index covers every NXT constituent, so a miss needs no search
+                return self.nxt_email_index.get(email_key)
+            if email_key in self.nxt_email_matches:
+                return self.nxt_email_matches[email_key]
+                
+        existing = self._search_nxt_constituents_by_email(email)
+        nxt_id = existing[0].get('id') if existing else None
+        with self._email_index_lock:
+            self.nxt_email_matches[email_key] = nxt_id
+        return nxt_id
+        
+    def _remember_constituent_email(self, email, nxt_id):
+        """Record a newly created constituent's email so later lookups find it.
+        
+        Args:
+            email: Email address of the constituent
+            nxt_id: NXT constituent ID
+        """
+        email_key = email.lower()
+        with self._email_index_lock:
+            if self.nxt_email_index is not None:
+                self.nxt_email_index[email_key] = nxt_id
+            self.nxt_email_matches[email_key] = nxt_id
+            
     def get_or_create_constituent(self, participant_data):
         """Get or create a constituent in NXT for a ServiceReef participant.
         
@@ -939,15 +1583,52 @@ class EventSyncService:
                 self.logger.warning("No ServiceReef ID found in participant data")
                 return None
                 
-            # Get member details from ServiceReef - we'll need this regardless of path
-            member_details = self._get_service_reef_member_details(service_reef_id)
+            # Constituents already resolved during this run need no further lookups
+            nxt_id = self.constituent_cache.get(service_reef_id)
+            if nxt_id:
+                self.logger.debug(f"Using cached constituent {nxt_id} for ServiceReef ID {service_reef_id}")
+                return nxt_id
+                
+            # Serialize resolution per member so a member registered for several
+            # events being synced concurrently is only looked up or created once
+            with self._mapping_lock:
+                member_lock = self._constituent_locks.setdefault(service_reef_id, threading.Lock())
+            with member_lock:
+                nxt_id = self.constituent_cache.get(service_reef_id)
+                if nxt_id:
+                    return nxt_id
+                return self._resolve_constituent(service_reef_id, participant_data)
+                
+        except Exception as e:
+            self.logger.error(f"Error in get_or_create_constituent: {str(e)}")
+            return None
+            
+    def _resolve_constituent(self, service_reef_id, participant_data):
+        """Find or create the NXT constituent for a ServiceReef member and cache it.
+        
+        Args:
+            service_reef_id: ServiceReef member ID
+            participant_data: Dict containing participant data from ServiceReef
+            
+        Returns:
+            str: NXT constituent ID if successful, None if failed
+        """
+        try:
+            # Get member details from ServiceReef - we'll need this regardless of path.
+            # Skip the extra request when the participant payload already carries them
+            # with the identifying fields filled in.
+            if (all(field in participant_data for field in self.MEMBER_DETAIL_FIELDS)
+                    and all(participant_data[field] for field in self.REQUIRED_MEMBER_FIELDS)):
+                member_details = participant_data
+            else:
+                member_details = self._get_service_reef_member_details(service_reef_id)
             if not member_details:
                 self.logger.error(f"Failed to get member details for ServiceReef ID {service_reef_id}")
                 return None
                 
             # Check existing mapping first
-            if service_reef_id in self.constituent_mapping:
-                nxt_id = self.constituent_mapping[service_reef_id]
+            nxt_id = self.constituent_mapping.get(service_reef_id)
+            if nxt_id:
                 self.logger.info(f"Found existing constituent mapping for ServiceReef ID {service_reef_id} -> NXT ID {nxt_id}")
                 
                 # Verify constituent still exists in NXT
@@ -957,6 +1638,7 @@ class EventSyncService:
                         # Check if constituent needs to be updated
                         self.logger.info(f"Checking for updates to constituent {nxt_id}")
                         self.update_nxt_constituent(nxt_id, member_details, nxt_constituent)
+                        self.constituent_cache[service_reef_id] = nxt_id
                         return nxt_id
                     else:
                         self.logger.warning(f"NXT constituent {nxt_id} no longer exists, will search for matches")
@@ -966,17 +1648,16 @@ class EventSyncService:
             # Search for existing constituent by email
             email = member_details.get('Email')
             if email:
-                existing = self._search_nxt_constituents(email=email)
-                if existing:
-                    nxt_id = existing[0].get('id')
+                nxt_id = self._find_constituent_by_email(email)
+                if nxt_id:
                     self.logger.info(f"Found existing constituent by email: {nxt_id}")
                     # Update mapping
-                    self.constituent_mapping[service_reef_id] = nxt_id
-                    self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
+                    self._set_constituent_mapping(service_reef_id, nxt_id)
                     
                     # Check if constituent needs to be updated
                     self.logger.info(f"Checking for updates to constituent {nxt_id}")
                     self.update_nxt_constituent(nxt_id, member_details)
+                    self.constituent_cache[service_reef_id] = nxt_id
                     return nxt_id
                     
             # Search by name as fallback
@@ -1011,12 +1692,12 @@ class EventSyncService:
                         self.logger.info(f"Found existing constituent by name: {nxt_id}")
                         
                     # Update mapping
-                    self.constituent_mapping[service_reef_id] = nxt_id
-                    self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
+                    self._set_constituent_mapping(service_reef_id, nxt_id)
                     
                     # Check if constituent needs to be updated
                     self.logger.info(f"Checking for updates to constituent {nxt_id}")
                     self.update_nxt_constituent(nxt_id, member_details)
+                    self.constituent_cache[service_reef_id] = nxt_id
                     return nxt_id
                     
             # No existing constituent found, create new one
@@ -1025,118 +1706,13 @@ class EventSyncService:
                 self.logger.error(f"Failed to create NXT constituent for ServiceReef ID {service_reef_id}")
                 return None
                 
+            self.constituent_cache[service_reef_id] = nxt_id
             return nxt_id
                 
         except Exception as e:
-            self.logger.error(f"Error in get_or_create_constituent: {str(e)}")
+            self.logger.error(f"Error resolving constituent for ServiceReef ID {service_reef_id}: {str(e)}")
             return None
             
-    def create_nxt_constituent(self, service_reef_id, member_details):
-        """Create a constituent in NXT.
-        
-        Args:
-            service_reef_id: The ServiceReef ID of the constituent
-            member_details: Dict containing member details from ServiceReef
-            
-        Returns:
-            str: NXT constituent ID if successful, None if failed
-        """
-        try:
-            self.logger.debug(f'Creating NXT constituent for ServiceReef ID {service_reef_id}')
-            self.logger.debug(f'Member details: {json.dumps(member_details, default=str)}')
-            
-            # Build constituent data according to Blackbaud NXT API requirements
-            constituent_data = {
-                'type': 'Individual',  # Required field
-                'first': member_details.get('FirstName', ''),  # Correct field name is 'first'
-                'last': member_details.get('LastName', ''),    # Correct field name is 'last'
-                'middle': member_details.get('MiddleName', ''),
-                'suffix': member_details.get('Suffix', ''),
-                'prefix': member_details.get('Prefix', ''),
-                'birthdate': member_details.get('DateOfBirth', '')
-            }
-            
-            # Add email if available - with required fields for NXT API
-            if member_details.get('Email'):
-                constituent_data['email'] = {
-                    'address': member_details['Email'],
-                    'type': 'Personal',
-                    'primary': True,
-                    'inactive': False,
-                    'do_not_email': False
-                }
-            
-            # Add phone number if available - with required fields for NXT API
-            if member_details.get('Phone'):
-                phone_number = self._format_phone_number(member_details['Phone'])
-                if phone_number:
-                    constituent_data['phone'] = {
-                        'number': phone_number,
-                        'type': 'Home',
-                        'primary': True,
-                        'inactive': False,
-                        'do_not_call': False
-                    }
-                    
-            # Add required address object - even if minimal
-            # Extract address data from ServiceReef (if available)
-            address_lines = 'No Address'
-            city = ''
-            state = ''
-            postal_code = ''
-            country = 'United States'
-            
-            # ServiceReef often provides address as a nested object
-            address_obj = member_details.get('Address', {})
-            if address_obj:
-                if address_obj.get('Street1'):
-                    address_lines = address_obj.get('Street1', '')
-                    if address_obj.get('Street2'):
-                        address_lines += ', ' + address_obj.get('Street2', '')
-                city = address_obj.get('City', '')
-                state = address_obj.get('State', '')
-                postal_code = address_obj.get('PostalCode', '')
-                country = address_obj.get('Country', 'United States') or 'United States'
-            
-            # Add required address object with all necessary fields
-            constituent_data['address'] = {
-                'address_lines': address_lines,
-                'city': city,
-                'state': state,
-                'postal_code': postal_code,
-                'country': country,
-                'type': 'Home',
-                'primary': True,
-                'inactive': False
-            }
-            
-            self.logger.debug(f'NXT constituent payload: {json.dumps(constituent_data, default=str)}')
-                
-            # Create constituent in NXT
-            response = self._handle_nxt_request('POST', '/constituent/v1/constituents', json_data=constituent_data)
-            
-            if not response:
-                self.logger.error('Failed to create constituent - no response')
-                return None
-            
-            nxt_constituent_id = response.get('id')
-            if not nxt_constituent_id:
-                self.logger.error('Failed to create constituent - no ID returned')
-                return None
-            
-            # Save mapping - always convert both IDs to strings
-            str_service_reef_id = str(service_reef_id)
-            str_nxt_id = str(nxt_constituent_id)
-            self.constituent_mapping[str_service_reef_id] = str_nxt_id
-            self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
-            
-            self.logger.info(f'Created NXT constituent {str_nxt_id} for ServiceReef ID {str_service_reef_id}')
-            return str_nxt_id
-            
-        except Exception as e:
-            self.logger.error(f"Error creating NXT constituent: {str(e)}")
-            return None
-        
     def _map_service_reef_status_to_nxt_rsvp(self, status, participant_data=None):
         """
         Maps ServiceReef status to NXT RSVP status.
@@ -1157,25 +1733,14 @@ class EventSyncService:
                 if field in participant_data:
                     self.logger.debug(f"[RSVP_DEBUG] {field}: '{participant_data.get(field)}'")
         
-        # Default RSVP status
-        rsvp_status = 'NoResponse'
-        
         # Standard mapping - simplified per user requirements
         normalized_status = status.lower() if status else ''
         self.logger.info(f"[RSVP_DEBUG] Normalized status: '{normalized_status}'")
         
-        # Per user requirements:
-        # - "declined" and "cancelled" should map to "Declined"
-        # - "registered" and "approved" should map to "Attending"
-        # - "waitingapproval" should map to "Attending" per client clarification
-        
-        # Define mapping rules with clearer logging
-        if normalized_status in ['approved', 'registered', 'waitingapproval']:
-            rsvp_status = 'Attending'
-            self.logger.info(f"[RSVP_DEBUG] Rule matched: '{normalized_status}' → 'Attending'")
-        elif normalized_status in ['declined', 'cancelled', 'draft']:
-            rsvp_status = 'Declined'
-            self.logger.info(f"[RSVP_DEBUG] Rule matched: '{normalized_status}' → 'Declined'")
+        # Look up the shared class-level mapping, defaulting to 'NoResponse'
+        rsvp_status = self.RSVP_STATUS_MAPPING.get(normalized_status)
+        if rsvp_status:
+            self.logger.info(f"[RSVP_DEBUG] Rule matched: '{normalized_status}' → '{rsvp_status}'")
         elif normalized_status == '':
             # Special case for empty status
             self.logger.warning(f"[RSVP_DEBUG] Empty status received, using default 'NoResponse'")
@@ -1200,10 +1765,11 @@ class EventSyncService:
         Returns:
             dict: NXT-ready participant payload
         """
-        self.logger.info(f'=== TRANSFORM PARTICIPANT DEBUG ===')
+        self.logger.debug(f'=== TRANSFORM PARTICIPANT DEBUG ===')
         self.logger.info(f'ServiceReef participant ID: {sr_data.get("Id")}, UserId: {sr_data.get("UserId")}')
         self.logger.info(f'Using NXT constituent_id: {constituent_id}')
-        self.logger.debug(f'Input ServiceReef data: {json.dumps(sr_data, indent=2, default=str)}')
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f'Input ServiceReef data: {_pretty_json(sr_data)}')
         
         # Verify constituent exists in NXT before using it
         try:
@@ -1255,7 +1821,8 @@ class EventSyncService:
         if host_id:
             nxt_payload['host_id'] = host_id
             
-        self.logger.debug(f'Transformed NXT payload: {json.dumps(nxt_payload, indent=2)}')
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f'Transformed NXT payload: {_pretty_json(nxt_payload)}')
         return nxt_payload
     
     def _update_nxt_participant_status(self, nxt_event_id, existing_participant, sr_participant_data):
@@ -1278,13 +1845,11 @@ class EventSyncService:
             constituent_id = existing_participant.get('constituent_id')
             participant_name = f"{existing_participant.get('first_name', '')} {existing_participant.get('last_name', '')}"
             
-            # Print detailed debug info for this participant
-            print(f"\n=== PARTICIPANT STATUS CHECK ===")
-            print(f"Participant: {participant_name} (ID: {participant_id}, Constituent ID: {constituent_id})")
-            print(f"Current NXT Status: RSVP={current_rsvp}, Attended={current_attended}")
+            # Log detailed debug info for this participant
+            self.logger.debug(f"Status check for participant {participant_name} (ID: {participant_id}, Constituent ID: {constituent_id}): "
+                              f"RSVP={current_rsvp}, Attended={current_attended}")
             
             if not participant_id:
-                print(f"Cannot update participant status: missing participant ID")
                 self.logger.warning("Cannot update participant status: missing participant ID")
                 return False
 
@@ -1294,11 +1859,12 @@ class EventSyncService:
                 self.logger.warning(f"[RSVP_DEBUG] Incomplete ServiceReef participant data detected. Attempting to refetch complete data.")
                 
                 # Debug the current participant data structure to better understand what we have
-                self.logger.info(f"[RSVP_DEBUG] Current participant data keys: {list(sr_participant_data.keys())}")
-                self.logger.info(f"[RSVP_DEBUG] Current participant data: {sr_participant_data}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"[RSVP_DEBUG] Current participant data keys: {list(sr_participant_data.keys())}")
+                    self.logger.debug(f"[RSVP_DEBUG] Current participant data: {sr_participant_data}")
                 
                 # Try to extract ServiceReef user ID for refetching
-                sr_user_id = sr_participant_data.get('UserId') or sr_participant_data.get('Id')
+                sr_user_id = _sr_user_id(sr_participant_data)
                 self.logger.info(f"[RSVP_DEBUG] Direct ServiceReef user ID extraction result: {sr_user_id}")
                 
                 # Get constituent ID from the NXT participant data
@@ -1341,9 +1907,11 @@ class EventSyncService:
                 self.logger.info(f"[RSVP_DEBUG] Looking for NXT event ID {nxt_event_id} in reverse mapping")
                 
                 # Find the ServiceReef event ID from the NXT event ID using reverse mapping
+                # Mapping values are already strings, so only the target needs converting
                 sr_event_id = None
+                target_nxt_event_id = str(nxt_event_id)
                 for sr_id, nxt_id in self.event_mapping.items():
-                    if str(nxt_id) == str(nxt_event_id):
+                    if nxt_id == target_nxt_event_id:
                         sr_event_id = sr_id
                         self.logger.info(f"[RSVP_DEBUG] Found ServiceReef event ID {sr_event_id} from event mapping")
                         break
@@ -1355,11 +1923,13 @@ class EventSyncService:
                 
                 # Alternative approach: If no mapping found but we have a user ID, try to get all events
                 # for this user and find one with participants that match our target
+                target_user_id = str(sr_user_id)
                 if not sr_event_id and sr_user_id:
                     self.logger.info(f"[RSVP_DEBUG] Trying alternative approach: find events by participant {sr_user_id}")
                     # For now, we'll use the 3 known test events from ServiceReef
                     test_event_ids = ["19818", "20124", "20537"]
                     
+                    # Check the events in order, stopping at the first that has the participant
                     for test_id in test_event_ids:
                         self.logger.info(f"[RSVP_DEBUG] Checking ServiceReef test event ID: {test_id}")
                         all_participants = self._get_service_reef_event_participants(test_id)
@@ -1367,8 +1937,7 @@ class EventSyncService:
                         
                         # Check if target participant is in this event
                         for p in all_participants:
-                            p_id = str(p.get('UserId') or p.get('Id', ''))
-                            if p_id == str(sr_user_id):
+                            if _sr_user_id(p) == target_user_id:
                                 sr_participant_data = p
                                 sr_event_id = test_id
                                 self.logger.info(f"[RSVP_DEBUG] Successfully found participant {p.get('FirstName')} {p.get('LastName')} in event {test_id}")
@@ -1393,7 +1962,8 @@ class EventSyncService:
                             self.logger.info(f"[RSVP_DEBUG] Successfully retrieved direct participant data from ServiceReef API")
                             sr_participant_data = direct_participant
                             participant_found = True
-                            self.logger.info(f"[RSVP_DEBUG] Direct participant data: {json.dumps(direct_participant, default=str)}")
+                            if self.logger.isEnabledFor(logging.INFO):
+                                self.logger.info(f"[RSVP_DEBUG] Direct participant data: {_compact_json(direct_participant)}")
                             
                             # Check for required fields
                             if 'RegistrationStatus' in direct_participant:
@@ -1413,8 +1983,7 @@ class EventSyncService:
                         # Find the specific participant we need by ID
                         participant_found = False
                         for p in all_participants:
-                            p_id = str(p.get('UserId') or p.get('Id', ''))
-                            if p_id == str(sr_user_id):
+                            if _sr_user_id(p) == target_user_id:
                                 sr_participant_data = p
                                 participant_found = True
                                 self.logger.info(f"[RSVP_DEBUG] Successfully refetched complete participant data for {p.get('FirstName')} {p.get('LastName')}")
@@ -1456,14 +2025,16 @@ class EventSyncService:
                         self.logger.error(f"[RSVP_DEBUG] Error getting member details: {str(e)}")
                 
                 # Final debug output of our enhanced participant data
-                self.logger.info(f"[RSVP_DEBUG] Final enhanced participant data keys: {list(sr_participant_data.keys())}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"[RSVP_DEBUG] Final enhanced participant data keys: {list(sr_participant_data.keys())}")
                 self.logger.info(f"[RSVP_DEBUG] First/Last name: {sr_participant_data.get('FirstName')} {sr_participant_data.get('LastName')}")
                 self.logger.info(f"[RSVP_DEBUG] Registration Status: {sr_participant_data.get('RegistrationStatus')}")
 
                 
             # Debug all available fields for comprehensive analysis
             self.logger.info(f"[RSVP_DEBUG] ==== Status Update Debug =====")
-            self.logger.info(f"[RSVP_DEBUG] Participant raw data keys: {list(sr_participant_data.keys())}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"[RSVP_DEBUG] Participant raw data keys: {list(sr_participant_data.keys())}")
             
             # Check which status fields are available
             if 'Status' in sr_participant_data:
@@ -1481,20 +2052,18 @@ class EventSyncService:
             sr_participant_name = f"{sr_participant_data.get('FirstName', '')} {sr_participant_data.get('LastName', '')}" 
             
             # Log all available fields for debugging
-            self.logger.info(f"[RSVP_DEBUG] Participant fields: {sorted(sr_participant_data.keys())}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"[RSVP_DEBUG] Participant fields: {sorted(sr_participant_data.keys())}")
             self.logger.info(f"[RSVP_DEBUG] ServiceReef Status: '{sr_status}', Attended={sr_attended}, Name={sr_participant_name}")
-            print(f"ServiceReef Status: {sr_status}, Attended={sr_attended}, Name={sr_participant_name}")
             
             # Map ServiceReef status to NXT RSVP status
             new_rsvp = self._map_service_reef_status_to_nxt_rsvp(sr_status)
             self.logger.info(f"[RSVP_DEBUG] Mapped ServiceReef status '{sr_status}' to NXT RSVP '{new_rsvp}'")
-            print(f"Mapped ServiceReef status '{sr_status}' to NXT RSVP '{new_rsvp}'")
             
             # Check if status has changed
             status_changed = (current_rsvp != new_rsvp) or (current_attended != sr_attended)
             
             if status_changed:
-                print(f"STATUS CHANGE DETECTED! Will update from '{current_rsvp}' to '{new_rsvp}'")
                 self.logger.info(
                     f"Participant status change detected: "
                     f"RSVP: '{current_rsvp}' -> '{new_rsvp}', "
@@ -1510,40 +2079,50 @@ class EventSyncService:
                     'attended': attended_value
                 }
                 
-                self.logger.info(f"[RSVP_DEBUG] Update payload: {json.dumps(update_data)}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"[RSVP_DEBUG] Update payload: {_compact_json(update_data)}")
                 
                 # Update participant status
                 endpoint = f"/event/v1/participants/{participant_id}"
                 self.logger.info(f"[RSVP_DEBUG] Sending PATCH request to {endpoint}")
-                print(f"Sending PATCH request to {endpoint}")
                 response = self._handle_nxt_request('PATCH', endpoint, json_data=update_data)
                 
                 # Log detailed response
                 if isinstance(response, dict):
-                    self.logger.info(f"[RSVP_DEBUG] Response: {json.dumps(response)}")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info(f"[RSVP_DEBUG] Response: {_compact_json(response)}")
                 elif response is not None:
                     self.logger.info(f"[RSVP_DEBUG] Response status: {response.status_code if hasattr(response, 'status_code') else 'Unknown'}")
                 else:
                     self.logger.warning(f"[RSVP_DEBUG] No response received from API")
                 
                 if response:
-                    print(f"SUCCESSFUL UPDATE: Participant {participant_id} status updated in event {nxt_event_id}")
                     self.logger.info(f"[RSVP_DEBUG] Successfully updated participant {participant_id} status in event {nxt_event_id}")
                     return True
                 else:
-                    print(f"UPDATE FAILED: Could not update participant {participant_id} status in event {nxt_event_id}")
                     self.logger.warning(f"[RSVP_DEBUG] Failed to update participant {participant_id} status in event {nxt_event_id}")
                     return False
             else:
-                print(f"No status change needed. Current RSVP '{current_rsvp}' matches mapped ServiceReef status '{new_rsvp}'")
                 self.logger.info(f"No status change detected for participant in event {nxt_event_id}")
                 return False
                 
         except Exception as e:
-            print(f"ERROR: {str(e)}")
             self.logger.error(f"Error updating participant status: {str(e)}")
             return False
     
+    def _member_details_digest(self, member_details):
+        """Compute a stable digest of the member fields pushed to NXT.
+        
+        Args:
+            member_details: Dict containing member details from ServiceReef
+            
+        Returns:
+            str: Hex digest of the member detail fields
+        """
+        get = member_details.get
+        fields = {field: get(field) for field in self.MEMBER_DETAIL_FIELDS}
+        return hashlib.blake2b(orjson.dumps(fields, default=str, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+        
     def update_nxt_constituent(self, nxt_id, member_details, existing_constituent=None):
         """Update an existing constituent in NXT if ServiceReef data has changed.
         
@@ -1555,6 +2134,13 @@ class EventSyncService:
         Returns:
             bool: True if successful update, False if failed or no update needed
         """
+        # Skip the email/phone/address round-trips when ServiceReef has not changed
+        # since the details were last pushed to this constituent
+        digest = self._member_details_digest(member_details)
+        if self.constituent_hashes.get(str(nxt_id)) == digest:
+            self.logger.debug(f"Member details unchanged for NXT constituent {nxt_id}, skipping update")
+            return False
+            
         try:
             # Get existing constituent data if not provided
             if not existing_constituent:
@@ -1572,38 +2158,26 @@ class EventSyncService:
             # Build update payload based on differences
             update_data = {}
             changed = False
+            failed = False
             
             # Check name fields
-            if member_details.get('FirstName') and member_details.get('FirstName') != existing_constituent.get('first'):
-                update_data['first_name'] = member_details['FirstName']
-                changed = True
-            
-            if member_details.get('LastName') and member_details.get('LastName') != existing_constituent.get('last'):
-                update_data['last_name'] = member_details['LastName']
-                changed = True
-            
-            if member_details.get('MiddleName') and member_details.get('MiddleName') != existing_constituent.get('middle'):
-                update_data['middle_name'] = member_details['MiddleName']
-                changed = True
-            
-            if member_details.get('Suffix') and member_details.get('Suffix') != existing_constituent.get('suffix'):
-                update_data['suffix'] = member_details['Suffix']
-                changed = True
-            
-            if member_details.get('Prefix') and member_details.get('Prefix') != existing_constituent.get('prefix'):
-                update_data['prefix'] = member_details['Prefix']
-                changed = True
+            for sr_field, nxt_field, update_field in self.NAME_FIELD_MAP:
+                value = member_details.get(sr_field)
+                if value and value != existing_constituent.get(nxt_field):
+                    update_data[update_field] = value
+                    changed = True
             
             # Check email - use our improved method that deletes existing emails and creates new ones
             # Only update if ServiceReef provides a non-empty email to prevent erasing existing emails
             if member_details.get('Email') and member_details.get('Email').strip():
                 self.logger.info(f"Updating email for constituent {nxt_id} with {member_details['Email']}")
                 # Use our dedicated email creation method which handles delete+create
-                if self._create_email_for_constituent(nxt_id, member_details['Email']):
+                if self._create_email_for_constituent(nxt_id, member_details['Email'], verified=True):
                     self.logger.info(f"Successfully updated email for constituent {nxt_id}")
                     changed = True
                 else:
                     self.logger.warning(f"Failed to update email for constituent {nxt_id}")
+                    failed = True
             else:
                 self.logger.info(f"No email provided in ServiceReef data for constituent {nxt_id}, preserving existing NXT emails")
                 
@@ -1612,12 +2186,13 @@ class EventSyncService:
             if member_details.get('Phone'):
                 self.logger.info(f"Updating phone for constituent {nxt_id} with {member_details['Phone']}")
                 # Use our dedicated phone creation method which handles delete+create
-                if self._create_phone_for_constituent(nxt_id, member_details['Phone']):
+                if self._create_phone_for_constituent(nxt_id, member_details['Phone'], verified=True):
                     self.logger.info(f"Successfully updated phone for constituent {nxt_id}")
                     phone_updated = True
                     changed = True
                 else:
                     self.logger.warning(f"Failed to update phone for constituent {nxt_id}")
+                    failed = True
             
             # Check address - handled separately from other constituent fields
             address_updated = False
@@ -1637,6 +2212,7 @@ class EventSyncService:
                         changed = True
                     else:
                         self.logger.error(f"Failed to create address for constituent {nxt_id}")
+                        failed = True
                         # Continue with updates even if address creation failed
                 else:
                     # Extract address fields from ServiceReef data
@@ -1671,7 +2247,8 @@ class EventSyncService:
                         
                         # Update address using dedicated endpoint
                         self.logger.info(f"Updating address {address_id} for constituent {nxt_id}")
-                        self.logger.info(f"Address update payload: {address_update_payload}")
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Address update payload: {address_update_payload}")
                         
                         # Debug the exact API call being made
                         # Use the standard address update endpoint with PATCH
@@ -1682,70 +2259,74 @@ class EventSyncService:
                         if 'constituent_id' in address_update_payload:
                             del address_update_payload['constituent_id']
                         
-                        # Make the API call with enhanced error handling
-                        print(f"Sending address update request to {self.nxt_base_url}{api_endpoint}")
-                        print(f"Address payload: {json.dumps(address_update_payload, indent=2)}")
-                        
-                        # Use PATCH for updating an existing address
-                        response = self._handle_nxt_request('PATCH', api_endpoint, 
-                                                          json_data=address_update_payload)
-                        
-                        print(f"Address update API response type: {type(response)}")
-                        
-                        if response is None:  # None response means error
-                            print("CRITICAL ERROR: Address update call failed with None response")
-                            self.logger.error(f"Address update failed for constituent {nxt_id} - API returned None")
-                        elif isinstance(response, requests.Response):
-                            print(f"Raw response status code: {response.status_code}")
-                            print(f"Raw response headers: {response.headers}")
-                            if response.status_code in [200, 201, 204]:
-                                print(f"SUCCESS: Address updated with status code {response.status_code}")
-                                self.logger.info(f"Successfully updated address for constituent {nxt_id} with status code {response.status_code}")
+                        # Use PATCH for updating an existing address; error statuses raise,
+                        # so any other response is a confirmed 2xx
+                        try:
+                            response = self._handle_nxt_request('PATCH', api_endpoint, 
+                                                              json_data=address_update_payload,
+                                                              raise_for_status=True)
+                        except NxtApiError as e:
+                            self.logger.error(f"NXT API returned errors for address update {address_id}: {e.body}")
+                            failed = True
+                        else:
+                            if response is None:  # None response means the request itself failed
+                                self.logger.error(f"Address update failed for constituent {nxt_id} - API returned None")
+                                failed = True
+                            else:
+                                self.logger.info(f"Successfully updated address for constituent {nxt_id}")
                                 address_updated = True
                                 changed = True
-                            else:
-                                print(f"ERROR: Address update failed with status code {response.status_code}")
-                                try:
-                                    print(f"Response content: {response.text}")
-                                except:
-                                    print("Could not extract response text")
-                        elif isinstance(response, dict) and 'errors' in response:
-                            print(f"ERROR: NXT API returned errors: {response['errors']}")
-                            self.logger.error(f"NXT API returned errors for address update {address_id}: {response['errors']}")
-                        else:
-                            print(f"UNEXPECTED RESPONSE TYPE: {type(response)}")
-                            print(f"Response content: {response}")
-                            self.logger.warning(f"Unexpected response when updating address {address_id}: {response}")
                         
                         self.logger.info(f"Address change detected and update attempted for constituent {nxt_id}")
                 
             # If no changes detected, skip update
             if not changed:
                 self.logger.info(f"No changes detected for NXT constituent {nxt_id}, skipping update")
+                if not failed:
+                    self._remember_member_digest(nxt_id, digest)
                 return False
             
             # Perform update for non-address fields if any changed
             constituent_updated = False
             if update_data:
-                self.logger.info(f"Sending update to NXT for constituent {nxt_id} with payload: {update_data}")
-                response = self._handle_nxt_request('PATCH', f'/constituent/v1/constituents/{nxt_id}', json_data=update_data)
-                
-                # Enhanced response handling
-                if response is None:  # None response means 204 No Content (success)
-                    self.logger.info(f"Successfully updated NXT constituent {nxt_id} properties")
-                    constituent_updated = True
-                elif isinstance(response, dict) and 'errors' in response:
-                    self.logger.error(f"NXT API returned errors for constituent {nxt_id}: {response['errors']}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"Sending update to NXT for constituent {nxt_id} with payload: {_compact_json(update_data)}")
+                try:
+                    response = self._handle_nxt_request('PATCH', f'/constituent/v1/constituents/{nxt_id}',
+                                                        json_data=update_data, raise_for_status=True)
+                except NxtApiError as e:
+                    self.logger.error(f"NXT API returned errors for constituent {nxt_id}: {e.body}")
+                    failed = True
                 else:
-                    self.logger.warning(f"Unexpected response when updating constituent {nxt_id}: {response}")
+                    if response is None:  # None response means the request itself failed
+                        self.logger.error(f"Update failed for NXT constituent {nxt_id} - API returned None")
+                        failed = True
+                    else:
+                        self.logger.info(f"Successfully updated NXT constituent {nxt_id} properties")
+                        constituent_updated = True
             
+            # Only a run where every attempted write was confirmed may skip the next one
+            if not failed:
+                self._remember_member_digest(nxt_id, digest)
+                
             # Return True if either address or constituent properties were successfully updated
             return constituent_updated or address_updated
         except Exception as e:
             self.logger.error(f"Error updating constituent {nxt_id}: {str(e)}")
             return False
     
-    def _create_email_for_constituent(self, constituent_id, email_address):
+    def _remember_member_digest(self, nxt_id, digest):
+        """Record the member details digest last pushed to an NXT constituent.
+        
+        Args:
+            nxt_id: NXT constituent ID
+            digest: Digest from _member_details_digest
+        """
+        with self._mapping_lock:
+            self.constituent_hashes[str(nxt_id)] = digest
+            self._constituent_hashes_dirty = True
+            
+    def _create_email_for_constituent(self, constituent_id, email_address, verified=False):
         """
         Create a new email for an NXT constituent.
         Only updates or creates email if needed, without deleting existing emails.
@@ -1753,6 +2334,7 @@ class EventSyncService:
         Args:
             constituent_id (str): The NXT constituent ID
             email_address (str): The email address to add
+            verified (bool): True if the caller has already fetched the constituent from NXT
             
         Returns:
             bool: True if successful, False if failed
@@ -1772,12 +2354,13 @@ class EventSyncService:
                 self.logger.error(f"Email '{email_address}' could not be formatted properly")
                 return False
                 
-            # First check if the constituent exists
-            self.logger.info(f"Verifying constituent exists before adding email: {constituent_id}")
-            constituent = self._get_nxt_constituent(constituent_id)
-            if not constituent:
-                self.logger.error(f"Cannot create email: constituent {constituent_id} not found in NXT")
-                return False
+            # First check if the constituent exists, unless the caller already has it
+            if not verified:
+                self.logger.info(f"Verifying constituent exists before adding email: {constituent_id}")
+                constituent = self._get_nxt_constituent(constituent_id)
+                if not constituent:
+                    self.logger.error(f"Cannot create email: constituent {constituent_id} not found in NXT")
+                    return False
             
             # Check existing email addresses to see if we need to make changes
             existing_emails = self._handle_nxt_request('GET', f'/constituent/v1/constituents/{constituent_id}/emailaddresses')
@@ -1818,74 +2401,25 @@ class EventSyncService:
                 
                 # Make the API call to create the new email
                 self.logger.info(f"Creating new email {formatted_email} for constituent {constituent_id}")
-                create_result = self._handle_nxt_request('POST', '/constituent/v1/emailaddresses', json_data=email_payload)
+                try:
+                    create_result = self._handle_nxt_request('POST', '/constituent/v1/emailaddresses',
+                                                             json_data=email_payload, raise_for_status=True)
+                except NxtApiError as e:
+                    self.logger.error(f"NXT API returned errors creating email for constituent {constituent_id}: {e.body}")
+                    return False
                 
-                if create_result:
+                if create_result is not None:
                     self.logger.info(f"Successfully created new email {formatted_email} for constituent {constituent_id}")
                     return True
                 else:
                     self.logger.error(f"Failed to create new email {formatted_email} for constituent {constituent_id}")
                     return False
             
-            # No email changes made
-            return True
-            
         except Exception as e:
             self.logger.error(f"Error in _create_email_for_constituent: {str(e)}")
             return False
-        
-            # Validate required fields per API documentation
-            if not email_payload['constituent_id']:
-                self.logger.error("Cannot create email: missing required field 'constituent_id'")
-                return False
-                
-            if not email_payload['address']:
-                self.logger.error("Cannot create email: missing required field 'address'")
-                return False
-                
-            if not email_payload['type']:
-                self.logger.error("Cannot create email: missing required field 'type'")
-                return False
-            
-            # Log detailed request information
-            self.logger.info(f"Creating email for constituent {constituent_id} with payload: {json.dumps(email_payload)}")
-            
-            # Create email using dedicated endpoint
-            endpoint = '/constituent/v1/emailaddresses'
-            self.logger.info(f"Sending request to {self.nxt_base_url}{endpoint}")
-            result = self._handle_nxt_request('POST', endpoint, json_data=email_payload)
-            
-            if result and isinstance(result, dict) and 'id' in result:
-                self.logger.info(f"Created new email {formatted_email} for constituent {constituent_id}, email ID: {result['id']}")
-                return True
-            else:
-                # Try to extract more detailed error information
-                error_detail = "Unknown error"
-                if isinstance(result, dict):
-                    if 'message' in result:
-                        error_detail = result['message']
-                    elif 'errors' in result:
-                        error_detail = str(result['errors'])
-                elif isinstance(result, str):
-                    error_detail = result
-                
-                self.logger.error(f"Failed to create email for constituent {constituent_id}: {error_detail}")
-                # Log specific error codes
-                if isinstance(result, dict) and 'status' in result:
-                    status_code = result['status']
-                    if status_code == 404:
-                        self.logger.error(f"404 Not Found: The constituent {constituent_id} was not found in NXT")
-                    elif status_code == 400:
-                        self.logger.error(f"400 Bad Request: The email payload format was incorrect")
-                    elif status_code == 403:
-                        self.logger.error(f"403 Forbidden: No permission to create email for constituent {constituent_id}")
-                
-                return False
-        except Exception as e:
-            self.logger.error(f"Error creating email for constituent {constituent_id}: {str(e)}")
-            return False
     
-    def _create_phone_for_constituent(self, constituent_id, phone_number):
+    def _create_phone_for_constituent(self, constituent_id, phone_number, verified=False):
         """
         Create a new phone number for an NXT constituent.
         First deletes any existing phones to ensure clean sync.
@@ -1893,6 +2427,7 @@ class EventSyncService:
         Args:
             constituent_id (str): The NXT constituent ID
             phone_number (str): The phone number to add
+            verified (bool): True if the caller has already fetched the constituent from NXT
             
         Returns:
             bool: True if successful, False if failed
@@ -1913,12 +2448,13 @@ class EventSyncService:
                 self.logger.error(f"Phone number '{phone_number}' could not be formatted properly")
                 return False
                 
-            # First check if the constituent exists
-            self.logger.info(f"Verifying constituent exists before adding phone: {constituent_id}")
-            constituent = self._get_nxt_constituent(constituent_id)
-            if not constituent:
-                self.logger.error(f"Cannot create phone: constituent {constituent_id} not found in NXT")
-                return False
+            # First check if the constituent exists, unless the caller already has it
+            if not verified:
+                self.logger.info(f"Verifying constituent exists before adding phone: {constituent_id}")
+                constituent = self._get_nxt_constituent(constituent_id)
+                if not constituent:
+                    self.logger.error(f"Cannot create phone: constituent {constituent_id} not found in NXT")
+                    return False
                 
             # First delete any existing phones to avoid duplicates
             existing_phones = self._handle_nxt_request('GET', f'/constituent/v1/constituents/{constituent_id}/phones')
@@ -1926,7 +2462,10 @@ class EventSyncService:
                 for phone in existing_phones['value']:
                     if 'id' in phone:
                         self.logger.info(f"Deleting existing phone {phone.get('number')} (ID: {phone['id']})")
-                        self._handle_nxt_request('DELETE', f'/constituent/v1/phones/{phone["id"]}')
+                        # A phone left behind would duplicate the new one, so a failed delete fails the update
+                        if self._handle_nxt_request('DELETE', f'/constituent/v1/phones/{phone["id"]}', raise_for_status=True) is None:
+                            self.logger.error(f"Failed to delete phone {phone['id']} for constituent {constituent_id}")
+                            return False
                 
             # Create payload for new phone - all fields required by API documentation
             phone_payload = {
@@ -1952,7 +2491,8 @@ class EventSyncService:
                 return False
             
             # Log detailed request information
-            self.logger.info(f"Creating phone for constituent {constituent_id} with payload: {json.dumps(phone_payload)}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Creating phone for constituent {constituent_id} with payload: {_compact_json(phone_payload)}")
             
             # Create phone using dedicated endpoint
             endpoint = '/constituent/v1/phones'
@@ -2195,9 +2735,9 @@ class EventSyncService:
                                 'city': address_payload['city'],
                                 'state': address_payload['state'],
                                 'postal_code': address_payload['postal_code'],
-                            })
+                            }, raise_for_status=True)
                             
-                            if patch_result:
+                            if patch_result is not None:
                                 self.logger.info(f"Successfully updated preferred address (ID: {address_id})")
                                 return True  # Successfully updated the preferred address
                             else:
@@ -2205,11 +2745,14 @@ class EventSyncService:
                         else:
                             # For non-preferred addresses, we can safely delete them
                             self.logger.info(f"Deleting non-preferred address (ID: {address_id})")
-                            self._handle_nxt_request('DELETE', f'/constituent/v1/addresses/{address_id}')
+                            if self._handle_nxt_request('DELETE', f'/constituent/v1/addresses/{address_id}', raise_for_status=True) is None:
+                                self.logger.error(f"Failed to delete address {address_id} for constituent {constituent_id}")
+                                return False
 
             
             # Log detailed request information
-            self.logger.info(f"Creating address for constituent {constituent_id} with payload: {json.dumps(address_payload)}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(f"Creating address for constituent {constituent_id} with payload: {_compact_json(address_payload)}")
             
             # Create address using dedicated endpoint
             endpoint = '/constituent/v1/addresses'
@@ -2379,63 +2922,130 @@ class EventSyncService:
             list: List of all participant data if successful, None if failed
         """
         try:
-            all_participants = []
-            page = 1
-            
-            print(f"\n=== DEBUG: NXT Event Participants Request ===")
-            print(f"Requesting participants for NXT event ID: {event_id}")
-            
-            while True:
-                endpoint = f"/event/v1/events/{event_id}/participants"
-                params = {
-                    'limit': self.page_size,
-                    'offset': (page - 1) * self.page_size
-                }
-                print(f"Requesting page {page} with params: {params}")
-                
-                response = self._handle_nxt_request('GET', endpoint, params=params)
-                if not response:
-                    print("No response received from NXT API")
-                    return None
-                
-                print(f"Response keys: {sorted(response.keys()) if isinstance(response, dict) else 'Not a dictionary'}")
-                    
-                participants = response.get('value', [])
-                if not participants:
-                    print(f"No participants found on page {page}")
-                    break
-                    
-                print(f"Found {len(participants)} participants on page {page}")
-                if participants and len(participants) > 0:
-                    sample = participants[0]
-                    print(f"Sample participant fields: {sorted(sample.keys()) if isinstance(sample, dict) else 'Not a dictionary'}")
-                    
-                all_participants.extend(participants)
-                
-                # Check if we've received all participants
-                count = response.get('count', 0)
-                print(f"Total count from API: {count}, Current retrieved: {len(all_participants)}")
-                if len(all_participants) >= count or len(participants) < self.page_size:
-                    print("All participants retrieved, breaking pagination loop")
-                    break
-                    
-                page += 1
-                
+            all_participants = list(self._iter_nxt_event_participants(event_id))
             self.logger.info(f"Retrieved {len(all_participants)} participants for event {event_id}")
-            
-            # Print summary of what we found
-            if all_participants:
-                print(f"\n=== DEBUG: NXT Participants Summary ===\nTotal: {len(all_participants)} participants")
-            else:
-                print("No NXT participants found for this event")
-                
             return all_participants
             
         except Exception as e:
             self.logger.error(f"Error getting NXT event participants: {str(e)}")
-            print(f"ERROR retrieving NXT participants: {str(e)}")
             return None
             
+    def _iter_nxt_event_participants(self, event_id):
+        """Yield the participants of an NXT event one page at a time.
+        
+        The first page reports the total count, so the remaining pages are
+        prefetched on the shared NXT executor through a sliding window of at
+        most max_workers requests while the caller consumes earlier pages.
+        
+        Args:
+            event_id: The NXT event ID
+            
+        Yields:
+            dict: Individual participant data
+            
+        Raises:
+            Exception: If a page of participants could not be fetched
+        """
+        endpoint = f"/event/v1/events/{event_id}/participants"
+        self.logger.debug(f"Requesting participants for NXT event ID: {event_id}")
+        
+        # Error responses raise NxtApiError rather than returning an error body that
+        # would read as an empty page and silently truncate the listing
+        response = self._handle_nxt_request('GET', endpoint, params={'limit': self.page_size, 'offset': 0},
+                                            raise_for_status=True)
+        if not response:
+            raise Exception(f"No response received from NXT API for event {event_id} participants")
+            
+        participants = response.get('value', [])
+        count = response.get('count', 0)
+        self.logger.debug(f"Total count from API: {count}, first page: {len(participants)}")
+        
+        yield from participants
+        
+        if len(participants) < self.page_size or count <= self.page_size:
+            return
+            
+        # Pages are independent once the count is known, so prefetch the rest and
+        # yield them in order as the caller consumes them
+        fetch_page = partial(self._handle_nxt_request, 'GET', endpoint, raise_for_status=True)
+        offsets = iter(range(self.page_size, count, self.page_size))
+        submit = self._nxt_executor.submit
+        pending = deque((offset, submit(fetch_page, params={'limit': self.page_size, 'offset': offset}))
+                        for offset in islice(offsets, self.max_workers))
+        try:
+            while pending:
+                offset, future = pending.popleft()
+                page = future.result()
+                for next_offset in islice(offsets, 1):
+                    pending.append((next_offset, submit(
+                        fetch_page, params={'limit': self.page_size, 'offset': next_offset})))
+                if not page:
+                    raise Exception(f"Failed to get participants at offset {offset} for event {event_id}")
+                yield from page.get('value', [])
+        finally:
+            # Don't leave prefetches queued once the caller stops early or a page fails
+            for _, future in pending:
+                future.cancel()
+            
+    def _build_constituent_payload(self, member_data):
+        """Build the ConstituentAdd payload for a ServiceReef member.
+        
+        Args:
+            member_data: Dict containing member details from ServiceReef
+            
+        Returns:
+            dict: Constituent payload for the NXT API
+        """
+        get = member_data.get
+        
+        # Extract address data from ServiceReef response
+        address_get = (get('Address') or {}).get
+        
+        # Create address data according to ConstituentAddressAdd schema
+        address_data = {
+            'type': 'Home',  # Must be from Address Types table
+            'address_lines': address_get('Address1', 'No Address'),  # Use Address1 as primary address line
+            'city': address_get('City', 'Unknown'),  # Provide defaults for required fields
+            'state': address_get('State', 'XX'),     # Use XX as placeholder state
+            'postal_code': address_get('Zip', '00000'),  # Use 00000 as placeholder zip
+            'country': address_get('Country', 'United States'),
+            'do_not_mail': False,
+            'inactive': False,
+            'primary': True
+        }
+        
+        # Create constituent data with all required fields
+        constituent_data = {
+            'type': 'Individual',
+            'first': get('FirstName', ''),  # Use correct field names from ServiceReef
+            'last': get('LastName', ''),
+            'email': {
+                'address': get('Email', ''),
+                'type': 'Email',
+                'primary': True,
+                'do_not_email': False,
+                'inactive': False
+            },
+            'address': address_data  # Primary address per API docs
+        }
+        
+        # Send the phone with the constituent itself (ConstituentAdd accepts a single
+        # 'phone') rather than verifying the new record and POSTing it separately
+        phone_number = get('Phone')
+        formatted_phone = self._format_phone_number(phone_number) if phone_number else None
+        if formatted_phone:
+            constituent_data['phone'] = {
+                'number': formatted_phone,
+                'type': 'Home',
+                'primary': True,
+                'do_not_call': False,
+                'inactive': False
+            }
+        elif phone_number:
+            self.logger.error(f"Phone number '{phone_number}' could not be formatted properly")
+            
+        return constituent_data
+        
     def create_nxt_constituent(self, service_reef_id, member_data):
         """Create a constituent in NXT.
         
@@ -2471,16 +3081,13 @@ class EventSyncService:
             email = member_data.get('Email')
             if email:
                 self.logger.debug(f"Searching for existing constituent with email: {email}")
-                existing = self._search_nxt_constituents_by_email(email)
+                existing_id = self._find_constituent_by_email(email)
                 
-                if existing and len(existing) > 0:
-                    # Use the first match
-                    existing_id = existing[0].get('id')
+                if existing_id:
                     self.logger.info(f"Found existing constituent by email: {existing_id}")
                     
                     # Update mapping
-                    self.constituent_mapping[str_service_reef_id] = existing_id
-                    self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
+                    self._set_constituent_mapping(str_service_reef_id, existing_id)
                     
                     # Return the existing ID
                     return existing_id
@@ -2499,51 +3106,13 @@ class EventSyncService:
                     self.logger.info(f"Found existing constituent by name: {existing_id}")
                     
                     # Update mapping
-                    self.constituent_mapping[str_service_reef_id] = existing_id
-                    self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
+                    self._set_constituent_mapping(str_service_reef_id, existing_id)
                     
                     # Return the existing ID
                     return existing_id
             
             # If we get here, we need to create a new constituent
-            # Create constituent data payload
-            # Extract address data from ServiceReef response
-            address_info = member_data.get('Address', {})
-            
-            # Create address data according to ConstituentAddressAdd schema
-            address_data = {
-                'type': 'Home',  # Must be from Address Types table
-                'address_lines': address_info.get('Address1', 'No Address'),  # Use Address1 as primary address line
-                'city': address_info.get('City', 'Unknown'),  # Provide defaults for required fields
-                'state': address_info.get('State', 'XX'),     # Use XX as placeholder state
-                'postal_code': address_info.get('Zip', '00000'),  # Use 00000 as placeholder zip
-                'country': address_info.get('Country', 'United States'),
-                'do_not_mail': False,
-                'inactive': False,
-                'primary': True
-            }
-            
-            # Create constituent data with all required fields
-            constituent_data = {
-                'type': 'Individual',
-                'first': member_data.get('FirstName', ''),  # Use correct field names from ServiceReef
-                'last': member_data.get('LastName', ''),
-                'email': {
-                    'address': member_data.get('Email', ''),
-                    'type': 'Email',
-                    'primary': True,
-                    'do_not_email': False,
-                    'inactive': False
-                },
-                'phones': [{
-                    'number': member_data.get('Phone', '555-555-5555'),  # Default phone if not provided
-                    'type': 'Home',
-                    'primary': True,
-                    'do_not_call': False,
-                    'inactive': False
-                }],
-                'address': address_data  # Primary address per API docs
-            }
+            constituent_data = self._build_constituent_payload(member_data)
             
             # Create constituent in NXT
             response = self._handle_nxt_request('POST', '/constituent/v1/constituents', json_data=constituent_data)
@@ -2558,18 +3127,12 @@ class EventSyncService:
                 return None
                 
             # Update mapping
-            self.constituent_mapping[service_reef_id] = constituent_id
-            self._save_mapping(self.constituent_mapping_file, self.constituent_mapping)
-            
-            # Create phone number with a separate API call if provided
-            if member_data.get('Phone'):
-                phone_number = member_data.get('Phone')
-                self.logger.debug(f"Adding phone {phone_number} for new constituent {constituent_id}")
-                phone_created = self._create_phone_for_constituent(constituent_id, phone_number)
-                if phone_created:
-                    self.logger.info(f"Added phone {phone_number} to constituent {constituent_id}")
-                else:
-                    self.logger.error(f"Failed to add phone {phone_number} to constituent {constituent_id}")
+            self._set_constituent_mapping(service_reef_id, constituent_id)
+            
+            # Another member sharing this email must match the new constituent
+            # rather than create a duplicate
+            if email:
+                self._remember_constituent_email(email, constituent_id)
             
             self.logger.info(f'Created NXT constituent {constituent_id} for ServiceReef ID {service_reef_id}')
             return constituent_id
@@ -2584,6 +3147,11 @@ class EventSyncService:
         1. Syncs all events
         2. Syncs all event participants
         
+        Mapping changes are compacted and the service is closed once the sync
+        finishes, so a direct call releases its sessions, executor and timers
+        too. Both steps are idempotent, so a surrounding context manager's exit
+        is then a no-op.
+        
         Returns:
             None
             
@@ -2600,6 +3168,9 @@ class EventSyncService:
         except Exception as e:
             self.logger.error(f"Error in sync_all: {str(e)}")
             raise
+        finally:
+            self.compact()
+            self.close()
             
     def sync_all_events(self):
         """Sync all events from ServiceReef to NXT.
@@ -2616,108 +3187,57 @@ class EventSyncService:
             Exception: If there is an error during sync
         """
         try:
-            # Get all ServiceReef events
-            events = self._handle_service_reef_request('GET', '/v1/events')
-            if not events:
-                self.logger.error("Failed to get events from ServiceReef")
-                return
-                
-            # Handle both list and dictionary responses from ServiceReef
-            sr_events = events if isinstance(events, list) else events.get('Results', [])
-            for sr_event in sr_events:
-                try:
-                    sr_event_id = str(sr_event.get('EventId'))
-                    
-                    # Check if we already have this event in NXT
+            # Stream ServiceReef events page by page; events are independent, so
+            # fetch their details and create them in NXT concurrently
+            sr_events = self._iter_service_reef('/v1/events', page_size=self.page_size)
+            event_count = 0
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = []
+                for sr_event in sr_events:
+                    event_count += 1
+                    # Skip events without an ID before any request goes out for them
+                    sr_event_id = _sr_event_id(sr_event)
+                    if not sr_event_id:
+                        self.logger.error(f"Event {sr_event.get('Name')} missing ID")
+                        continue
+                    # Events already in NXT need no worker
                     if sr_event_id in self.event_mapping:
                         self.logger.info(f"Event {sr_event_id} already exists in NXT")
                         continue
+                    futures.append(executor.submit(self._sync_one_event, sr_event_id))
+                for future in futures:
+                    future.result()
                     
-                    # Get detailed event information
-                    event_details = self._get_service_reef_event_details(sr_event_id)
-                    if not event_details:
-                        self.logger.error(f"Failed to get details for event {sr_event_id}")
-                        continue
-                        
-                    # Create event in NXT
-                    nxt_event_id = self._create_nxt_event(event_details)
-                    if not nxt_event_id:
-                        self.logger.error(f"Failed to create event {sr_event_id} in NXT")
-                        continue
-                        
-                    self.logger.info(f"Created event {sr_event_id} in NXT with ID {nxt_event_id}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error syncing event {sr_event_id}: {str(e)}")
-                    continue
+            if not event_count:
+                self.logger.error("Failed to get events from ServiceReef")
                     
         except Exception as e:
             self.logger.error(f"Error syncing events: {str(e)}")
             raise
-    def _sync_event_participants(self):
-        """Sync all event participants from ServiceReef to NXT.
+            
+    def _sync_one_event(self, sr_event_id):
+        """Create a single ServiceReef event in NXT.
         
-        For each event in ServiceReef:
-        1. Get all participants
-        2. For each participant:
-            a. Get or create constituent in NXT
-            b. Add participant to NXT event
+        Args:
+            sr_event_id: ServiceReef event ID not yet mapped to NXT
         """
         try:
-            # Get all ServiceReef events
-            events = self._handle_service_reef_request('GET', '/v1/events')
-            if not events or 'Results' not in events:
-                self.logger.error("Failed to get events from ServiceReef")
+            # Get detailed event information
+            event_details = self._get_service_reef_event_details(sr_event_id)
+            if not event_details:
+                self.logger.error(f"Failed to get details for event {sr_event_id}")
+                return
+                
+            # Create event in NXT
+            nxt_event_id = self._create_nxt_event(event_details)
+            if not nxt_event_id:
+                self.logger.error(f"Failed to create event {sr_event_id} in NXT")
                 return
+                
+            self.logger.info(f"Created event {sr_event_id} in NXT with ID {nxt_event_id}")
             
-            sr_events = events.get('Results', [])
-            for event in sr_events:
-                try:
-                    sr_event_id = str(event.get('EventId') or event.get('Id'))
-                    nxt_event_id = self.event_mapping.get(sr_event_id)
-                    
-                    if not sr_event_id:
-                        self.logger.warning(f"Skipping event {event.get('Name')} - missing ServiceReef ID")
-                        continue
-                        
-                    if not nxt_event_id:
-                        self.logger.warning(f"Skipping event {event.get('Name')} - not yet synced to NXT")
-                        continue
-                        
-                    # Get all participants for this event
-                    participants = self._get_service_reef_event_participants(sr_event_id)
-                    
-                    for participant in participants:
-                        try:
-                            # Get or create constituent
-                            nxt_constituent_id = self.get_or_create_constituent(participant)
-                            
-                            if not nxt_constituent_id:
-                                self.logger.warning(f'Could not get/create constituent for participant {participant.get("Id")}')
-                                continue
-                                
-                            # Create participant in NXT event
-                            self._create_nxt_participant(
-                                nxt_event_id,
-                                {
-                                    'ConstituentId': nxt_constituent_id,
-                                    'RSVPStatus': participant.get('RSVPStatus', 'NoResponse'),
-                                    'InvitationStatus': participant.get('InvitationStatus', 'NotApplicable'),
-                                    'Attended': participant.get('Attended', False),
-                                    'HostId': participant.get('HostId')
-                                }
-                            )
-                            
-                        except Exception as e:
-                            self.logger.error(f'Error syncing participant {participant.get("Id")}: {str(e)}')
-                            continue
-                            
-                except Exception as e:
-                    self.logger.error(f'Error syncing participants for event {event.get("Name")}: {str(e)}')
-                    continue
         except Exception as e:
-            self.logger.error(f'Error in _sync_event_participants: {str(e)}')
-            raise
+            self.logger.error(f"Error syncing event {sr_event_id}: {str(e)}")
             
     def sync_all_event_participants(self):
         """Sync all event participants from ServiceReef to NXT.
@@ -2735,68 +3255,55 @@ class EventSyncService:
             Exception: If there is an error during sync
         """
         try:
-            # Get all ServiceReef events
-            events = self._handle_service_reef_request('GET', '/v1/events')
-            if not events:
-                self.logger.error("Failed to get events from ServiceReef")
-                return
+            # Without a constituent mapping every participant would need its own
+            # search, so list NXT constituents once up front instead
+            if not self.constituent_mapping:
+                self._prime_constituent_index()
                 
-            # Handle both list and dictionary responses from ServiceReef
-            sr_events = events if isinstance(events, list) else events.get('Results', [])
+            # Stream ServiceReef events page by page, keeping only those already in NXT
+            mapped_events = self._mapped_events(self._iter_service_reef('/v1/events', page_size=self.page_size))
             
-            for sr_event in sr_events:
-                try:
-                    sr_event_id = str(sr_event.get('EventId') or sr_event.get('Id'))
-                    if not sr_event_id:
-                        self.logger.error(f"Event {sr_event.get('Name')} missing ID")
-                        continue
-                    
-                    if sr_event_id in self.event_mapping:
-                        nxt_event_id = self.event_mapping[sr_event_id]
-                        self.sync_event_participants(sr_event_id, nxt_event_id)
-                except Exception as e:
-                    self.logger.error(f"Error syncing event {sr_event.get('Name', 'Unknown')}: {str(e)}")
-                    continue
+            # Events are independent, so sync their participants concurrently
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(lambda mapped_event: self._sync_one_event_participants(*mapped_event), mapped_events))
                     
         except Exception as e:
             self.logger.error(f"Error getting ServiceReef events: {str(e)}")
             raise
             
-    def sync_event_participants(self, service_reef_event_id, nxt_event_id):
-        """Sync all participants for a given ServiceReef event to NXT.
+    def _mapped_events(self, sr_events):
+        """Filter ServiceReef events down to those already mapped to an NXT event.
         
         Args:
-            service_reef_event_id: ServiceReef event ID
-            nxt_event_id: NXT event ID
+            sr_events: Iterable of event dicts from ServiceReef
             
-        Returns:
-            bool: True if successful, False if failed
+        Yields:
+            tuple: (ServiceReef event ID, NXT event ID, event name)
+        """
+        event_mapping_get = self.event_mapping.get
+        for sr_event in sr_events:
+            sr_event_id = _sr_event_id(sr_event)
+            if not sr_event_id:
+                self.logger.error(f"Event {sr_event.get('Name')} missing ID")
+                continue
+            nxt_event_id = event_mapping_get(sr_event_id)
+            if nxt_event_id:
+                yield sr_event_id, nxt_event_id, sr_event.get('Name', 'Unknown')
+                
+    def _sync_one_event_participants(self, sr_event_id, nxt_event_id, event_name):
+        """Sync participants for a single ServiceReef event that is mapped to NXT.
+        
+        Args:
+            sr_event_id: ServiceReef event ID
+            nxt_event_id: NXT event ID
+            event_name: Event name, used in error messages
         """
         try:
-            self.logger.info(f"Syncing participants for ServiceReef event {service_reef_event_id} to NXT event {nxt_event_id}")
-            
-            # Get ServiceReef event participants
-            participants = self._handle_service_reef_request('GET', f'/v1/events/{service_reef_event_id}/participants')
-            if not participants:
-                self.logger.info(f"No participants found for ServiceReef event {service_reef_event_id}")
-                return True
-                
-            self.logger.info(f"Found {len(participants)} participants for ServiceReef event {service_reef_event_id}")
-            
-            # Sync each participant - include ALL participants regardless of status
-            # This ensures even cancelled participants are synced
-            success_count = 0
-            for participant in participants:
-                self.logger.info(f"Syncing participant {participant.get('FirstName')} {participant.get('LastName')}, Status: {participant.get('Status', participant.get('RegistrationStatus', 'Unknown'))}")
-                if self._sync_event_participant(nxt_event_id, participant):
-                    success_count += 1
-                    
-            self.logger.info(f"Successfully synced {success_count} of {len(participants)} participants")
-            return success_count > 0
-            
+            self.sync_event_participants(sr_event_id, nxt_event_id)
+            # Persist the mappings created for this event before moving on
+            self.checkpoint()
         except Exception as e:
-            self.logger.error(f"Error in sync_event_participants: {str(e)}")
-            return False
+            self.logger.error(f"Error syncing event {event_name}: {str(e)}")
             
     def _get_service_reef_event_participants(self, event_id):
         """Get participants for an event from ServiceReef.
@@ -2811,94 +3318,59 @@ class EventSyncService:
             Exception: If there is an error getting participants
         """
         try:
-            # First check if we need the endpoint with 'Results' pagination structure
-            # or direct array response based on API version/endpoint behavior
-            response = self._handle_service_reef_request('GET', f'/v1/events/{event_id}/participants')
-            
-            # Process response based on its structure
-            raw_participants = []
-            
-            if isinstance(response, dict) and 'Results' in response:
-                # Handle paginated response format
-                self.logger.info(f"Got paginated participant data for event {event_id}")
-                raw_participants = response.get('Results', [])
-            elif isinstance(response, list):
-                # Handle direct array response
-                self.logger.info(f"Got direct list of {len(response)} participants for event {event_id}")
-                raw_participants = response
-            else:
-                self.logger.error(f"Unexpected participant data format for event {event_id}: {type(response)}")
-                return []
-            
-            # Enhanced debug logging for participant data
-            if raw_participants:
-                self.logger.info(f"Retrieved {len(raw_participants)} participants for event {event_id}")
-                
-                # Debug the first participant's structure to verify fields
-                if raw_participants:
-                    first_participant = raw_participants[0]
-                    self.logger.info("\n=== DEBUG: ServiceReef Participant Structure ===")
-                    self.logger.info(f"Available fields: {sorted(first_participant.keys())}")
-                    
-                    # Specifically check for RegistrationStatus
-                    if 'RegistrationStatus' in first_participant:
-                        self.logger.info(f"RegistrationStatus field found: '{first_participant['RegistrationStatus']}'")
-                    else:
-                        self.logger.warning("RegistrationStatus field missing from participant data!")
-                        
-                    # Look for potential alternative status fields
-                    for key in first_participant.keys():
-                        if 'status' in key.lower():
-                            self.logger.info(f"Potential status field: {key} = '{first_participant[key]}'")
-            else:
-                self.logger.warning(f"No participants found for event {event_id}")
-                return []
-            
-            # ENHANCED IMPLEMENTATION: Validate and complete participant data
-            # This ensures we don't pass incomplete data to downstream processes
-            complete_participants = []
+            # Stream the participant pages (or a direct array response), indexing each
+            # page by UserId while the next pages are still being fetched, so
+            # duplicates collapse without buffering the raw listing first
+            participants_by_id = {}
             incomplete_count = 0
+            raw_count = 0
+            first_participant = None
             
-            for participant in raw_participants:
+            for participant in self._iter_service_reef(f'/v1/events/{event_id}/participants', page_size=self.page_size):
+                raw_count += 1
+                if first_participant is None:
+                    first_participant = participant
+                    
                 # Check for mandatory fields
                 user_id = participant.get('UserId')
                 if not user_id:
                     self.logger.warning("Skipping participant with missing UserId")
                     incomplete_count += 1
                     continue
-                    
-                # Make sure we have RegistrationStatus
-                if 'RegistrationStatus' not in participant or not participant.get('RegistrationStatus'):
-                    self.logger.info(f"Fetching complete participant data for UserId {user_id}")
-                    
-                    # Try to get detailed participant info directly from ServiceReef
-                    try:
-                        detailed_participant = self._handle_service_reef_request(
-                            'GET', 
-                            f'/v1/events/{event_id}/participants/{user_id}'
-                        )
-                        
-                        if detailed_participant and isinstance(detailed_participant, dict):
-                            # Update with detailed participant data
-                            participant.update(detailed_participant)
-                            self.logger.info(f"Enhanced participant data with details from ServiceReef API")
-                            
-                            # Check if we now have RegistrationStatus
-                            if 'RegistrationStatus' in participant and participant['RegistrationStatus']:
-                                self.logger.info(f"Successfully retrieved RegistrationStatus: '{participant['RegistrationStatus']}'")
-                            else:
-                                # If still missing, try alternative API endpoint for member details
-                                member_details = self._get_service_reef_member_details(user_id)
-                                if member_details:
-                                    # Look for registration status in member details
-                                    for key, value in member_details.items():
-                                        if 'status' in key.lower() and value:
-                                            participant['RegistrationStatus'] = value
-                                            self.logger.info(f"Used member status '{value}' from key '{key}'")
-                                            break
-                    except Exception as detail_error:
-                        self.logger.error(f"Error fetching detailed participant data: {str(detail_error)}")
+                participants_by_id.setdefault(str(user_id), participant)
+                
+            if first_participant is None:
+                self.logger.warning(f"No participants found for event {event_id}")
+                return []
                 
+            # Enhanced debug logging for participant data
+            self.logger.info(f"Retrieved {raw_count} participants for event {event_id}")
+            
+            # Debug the first participant's structure to verify fields
+            if 'RegistrationStatus' not in first_participant:
+                self.logger.warning("RegistrationStatus field missing from participant data!")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("=== DEBUG: ServiceReef Participant Structure ===")
+                self.logger.debug(f"Available fields: {sorted(first_participant.keys())}")
+                
+                # Specifically check for RegistrationStatus
+                if 'RegistrationStatus' in first_participant:
+                    self.logger.debug(f"RegistrationStatus field found: '{first_participant['RegistrationStatus']}'")
+                    
+                # Look for potential alternative status fields
+                for key in first_participant.keys():
+                    if 'status' in key.lower():
+                        self.logger.debug(f"Potential status field: {key} = '{first_participant[key]}'")
+                
+            # Fetch details concurrently for participants missing RegistrationStatus
+            missing = [p for p in participants_by_id.values() if not p.get('RegistrationStatus')]
+            if missing:
+                self.logger.info(f"Fetching complete participant data for {len(missing)} participants")
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    list(executor.map(partial(self._complete_service_reef_participant, event_id), missing))
+            
+            complete_participants = []
+            for user_id, participant in participants_by_id.items():
                 # Final validation - only include participants with required fields
                 if not participant.get('RegistrationStatus'):
                     # If we still don't have a status, set a default that won't cause problems
@@ -2914,6 +3386,42 @@ class EventSyncService:
             self.logger.error(f'Error getting participants for event {event_id}: {str(e)}')
             return []
             
+    def _complete_service_reef_participant(self, event_id, participant):
+        """Fill in a participant's RegistrationStatus from the ServiceReef detail endpoints.
+        
+        Args:
+            event_id: ServiceReef event ID
+            participant: Participant dict to update in place
+        """
+        user_id = participant.get('UserId')
+        try:
+            # Try to get detailed participant info directly from ServiceReef
+            detailed_participant = self._handle_service_reef_request(
+                'GET', 
+                f'/v1/events/{event_id}/participants/{user_id}'
+            )
+            
+            if detailed_participant and isinstance(detailed_participant, dict):
+                # Update with detailed participant data
+                participant.update(detailed_participant)
+                self.logger.info(f"Enhanced participant data with details from ServiceReef API")
+                
+                # Check if we now have RegistrationStatus
+                if 'RegistrationStatus' in participant and participant['RegistrationStatus']:
+                    self.logger.info(f"Successfully retrieved RegistrationStatus: '{participant['RegistrationStatus']}'")
+                else:
+                    # If still missing, try alternative API endpoint for member details
+                    member_details = self._get_service_reef_member_details(user_id)
+                    if member_details:
+                        # Look for registration status in member details
+                        for key, value in member_details.items():
+                            if 'status' in key.lower() and value:
+                                participant['RegistrationStatus'] = value
+                                self.logger.info(f"Used member status '{value}' from key '{key}'")
+                                break
+        except Exception as detail_error:
+            self.logger.error(f"Error fetching detailed participant data: {str(detail_error)}")
+            
     def _get_service_reef_member_details(self, member_id):
         """Get member details from ServiceReef.
         
@@ -2926,6 +3434,27 @@ class EventSyncService:
         Raises:
             Exception: If there is an error getting member details
         """
+        # A member can be looked up by several participants and sync paths in one run
+        cache_key = str(member_id)
+        member_details = self.member_details_cache.get(cache_key)
+        if member_details is not None:
+            return member_details
+            
+        member_details = self._fetch_service_reef_member_details(member_id)
+        if member_details is not None:
+            # Failed lookups are not cached so a later caller can retry them
+            self.member_details_cache[cache_key] = member_details
+        return member_details
+        
+    def _fetch_service_reef_member_details(self, member_id):
+        """Fetch member details from the ServiceReef API, bypassing the run cache.
+        
+        Args:
+            member_id: ServiceReef member ID
+            
+        Returns:
+            dict: Member details if successful, None if not found
+        """
         try:
             data = self._handle_service_reef_request('GET', f'/v1/members/{member_id}')
             if not data:
@@ -3000,31 +3529,18 @@ class EventSyncService:
             Exception: If there is an error creating event
         """
         try:
-            # Get ServiceReef event ID
-            service_reef_event_id = str(event_details.get('EventId', ''))
-            
-            # If we don't have an EventId, try to use Id as fallback
-            if not service_reef_event_id:
-                service_reef_event_id = str(event_details.get('Id', ''))
-                
+            # Get ServiceReef event ID, using Id as fallback; a missing ID is never
+            # stringified to 'None' and sent to NXT
+            service_reef_event_id = _sr_event_id(event_details)
             if not service_reef_event_id:
                 self.logger.error("No ServiceReef event ID found in event details")
                 return None
                 
             # Check if we have a mapping for this event already
-            mapping_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'event_mapping.json')
-            if os.path.exists(mapping_file_path):
-                try:
-                    with open(mapping_file_path, 'r') as f:
-                        event_mapping = json.load(f)
-                        
-                    # Check if this ServiceReef event is already mapped
-                    if service_reef_event_id in event_mapping:
-                        nxt_event_id = event_mapping[service_reef_event_id]
-                        self.logger.info(f"Found existing mapping for ServiceReef event {service_reef_event_id} to NXT event {nxt_event_id}")
-                        return nxt_event_id
-                except Exception as e:
-                    self.logger.error(f"Error reading event mapping file: {str(e)}")
+            nxt_event_id = self.event_mapping.get(service_reef_event_id)
+            if nxt_event_id:
+                self.logger.info(f"Found existing mapping for ServiceReef event {service_reef_event_id} to NXT event {nxt_event_id}")
+                return nxt_event_id
             
             # If we don't have a mapping, check if event exists by name
             event_name = event_details.get('Name')
@@ -3052,20 +3568,7 @@ class EventSyncService:
             # Format date correctly - NXT requires YYYY-MM-DD format
             start_date = event_details.get('StartDate')
             if start_date:
-                # Extract just the date portion in YYYY-MM-DD format
-                if 'T' in start_date:
-                    start_date = start_date.split('T')[0]
-                elif ' ' in start_date:
-                    start_date = start_date.split(' ')[0]
-                
-                # Ensure date format is YYYY-MM-DD
-                if '/' in start_date:
-                    parts = start_date.split('/')
-                    if len(parts) == 3:
-                        if len(parts[2]) == 4:  # MM/DD/YYYY format
-                            start_date = f"{parts[2]}-{parts[0].zfill(2)}-{parts[1].zfill(2)}"
-                        else:  # DD/MM/YYYY format
-                            start_date = f"{parts[2]}-{parts[1].zfill(2)}-{parts[0].zfill(2)}"
+                start_date = _format_nxt_date(start_date)
             else:
                 self.logger.warning("No start date provided for event")
                 start_date = None
@@ -3123,27 +3626,15 @@ class EventSyncService:
             service_reef_event_id = str(service_reef_event_id)
             nxt_event_id = str(nxt_event_id)
             
-            mapping_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'event_mapping.json')
-            event_mapping = {}
-            
-            # Read existing mapping if available
-            if os.path.exists(mapping_file_path):
-                try:
-                    with open(mapping_file_path, 'r') as f:
-                        event_mapping = json.load(f)
-                except Exception as e:
-                    self.logger.error(f"Error reading event mapping file: {str(e)}")
-                    # Continue with empty mapping if file is corrupted
-            
-            # Update mapping
-            if service_reef_event_id in event_mapping and event_mapping[service_reef_event_id] != nxt_event_id:
-                self.logger.warning(f"Updating mapping for ServiceReef event {service_reef_event_id} from {event_mapping[service_reef_event_id]} to {nxt_event_id}")
-            
-            event_mapping[service_reef_event_id] = nxt_event_id
-            
-            # Write updated mapping
-            with open(mapping_file_path, 'w') as f:
-                json.dump(event_mapping, f, indent=2, sort_keys=True)
+            with self._event_mapping_lock:
+                # Update mapping
+                if service_reef_event_id in self.event_mapping and self.event_mapping[service_reef_event_id] != nxt_event_id:
+                    self.logger.warning(f"Updating mapping for ServiceReef event {service_reef_event_id} from {self.event_mapping[service_reef_event_id]} to {nxt_event_id}")
+                
+                self.event_mapping[service_reef_event_id] = nxt_event_id
+                
+                # Append to the event mapping log; compact() rewrites the mapping file
+                self._event_mapping_log.write(orjson.dumps({service_reef_event_id: nxt_event_id}) + b'\n')
                 
             self.logger.info(f"Updated event mapping: ServiceReef {service_reef_event_id} -> NXT {nxt_event_id}")
             return True
@@ -3167,9 +3658,10 @@ class EventSyncService:
         """
         try:
             # Debug full participant data
-            self.logger.info(f"=== SYNC EVENT PARTICIPANT - DEBUG ===")
-            self.logger.info(f"Syncing participant to NXT event ID: {event_id}")
-            self.logger.info(f"Participant data: {json.dumps(participant_data, indent=2, default=str)}")
+            self.logger.debug(f"=== SYNC EVENT PARTICIPANT - DEBUG ===")
+            self.logger.debug(f"Syncing participant to NXT event ID: {event_id}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Participant data: {_compact_json(participant_data)}")
             
             # Get or create constituent
             service_reef_id = participant_data.get('UserId')
@@ -3201,10 +3693,6 @@ class EventSyncService:
             self.logger.error(f"Error syncing participant: {str(e)}")
             return False
             
-        except Exception as e:
-            self.logger.error(f'Error getting member details for ID {member_id}: {str(e)}')
-            return None
-            
     def process_event(self, event_id, ignore_sync_log=False):
         """Process a complete event sync from ServiceReef to NXT
         
@@ -3255,31 +3743,74 @@ class EventSyncService:
             Exception: If there is an error syncing participants
         """
         try:
-            # Get participants from ServiceReef
+            # Stream participants from ServiceReef page by page, so the first page
+            # is already syncing while later pages are being fetched
             self.logger.info(f'Fetching participants for ServiceReef event {sr_event_id}')
-            participants = self._handle_service_reef_request('GET', f'/v1/events/{sr_event_id}/participants')
+            participants = self._unique_participants(
+                self._iter_service_reef(f'/v1/events/{sr_event_id}/participants', page_size=self.page_size)
+            )
+            
+            # Decide on bulk constituent resolution from the first page alone, so the
+            # rest of the listing keeps streaming
+            first_page = list(islice(participants, self.page_size))
+            self._bulk_resolve_constituents(first_page)
             
-            if not participants:
+            # Participants are synced concurrently; mapping writes are lock-guarded
+            sync_participant = partial(self._sync_one_participant, sr_event_id, nxt_event_id)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                participant_count = len(list(executor.map(sync_participant, chain(first_page, participants))))
+                
+            if not participant_count:
                 self.logger.warning(f'No participants found for event {sr_event_id}')
                 return
                 
-            self.logger.info(f'Found {len(participants)} participants for event {sr_event_id}')
-            self.logger.debug(f'Raw participant data from ServiceReef: {json.dumps(participants, indent=2)}')
-                
-            for participant in participants:
-                try:
-                    self.logger.info(f'Processing participant {participant.get("Id")} with data: {json.dumps(participant, indent=2)}')
-                    # Sync individual participant
-                    success = self._sync_event_participant(nxt_event_id, participant)
-                    if not success:
-                        self.logger.error(f'Failed to sync participant {participant.get("Id")} for event {sr_event_id}')
-                except Exception as e:
-                    self.logger.error(f'Error syncing participant {participant.get("Id")}: {str(e)}')
-                
+            self.logger.info(f'Processed {participant_count} participants for event {sr_event_id}')
+            
         except Exception as e:
             self.logger.error(f'Error creating/updating event: {str(e)}')
             return None
             
+    def _unique_participants(self, participants):
+        """Drop repeated ServiceReef participants, keeping the first entry per UserId.
+        
+        Args:
+            participants: Iterable of participant dicts from ServiceReef
+            
+        Yields:
+            dict: Participants with a UserId not seen before; entries without
+                  a UserId are passed through for the caller to report
+        """
+        seen = set()
+        for participant in participants:
+            user_id = participant.get('UserId')
+            if user_id is not None:
+                user_id = str(user_id)
+                if user_id in seen:
+                    self.logger.debug(f"Skipping duplicate participant entry for ServiceReef ID {user_id}")
+                    continue
+                seen.add(user_id)
+            yield participant
+            
+    def _sync_one_participant(self, sr_event_id, nxt_event_id, participant):
+        """Sync a single ServiceReef participant, logging rather than raising on failure.
+        
+        Args:
+            sr_event_id: ServiceReef event ID
+            nxt_event_id: NXT event ID
+            participant: Dict containing participant data from ServiceReef
+        """
+        # Resolved once for every log line below; participants usually only carry UserId
+        participant_id = participant.get('Id') or participant.get('UserId')
+        try:
+            # The full participant payload is logged by _sync_event_participant
+            self.logger.info(f'Processing participant {participant_id}')
+            # Sync individual participant
+            success = self._sync_event_participant(nxt_event_id, participant)
+            if not success:
+                self.logger.error(f'Failed to sync participant {participant_id} for event {sr_event_id}')
+        except Exception as e:
+            self.logger.error(f'Error syncing participant {participant_id}: {str(e)}')
+            
     def _get_service_reef_event_details(self, event_id):
         """Get detailed event information from ServiceReef.
         
@@ -3304,7 +3835,69 @@ class EventSyncService:
             self.logger.error(f'Error getting event details for ID {event_id}: {str(e)}')
             return None
             
-    def _handle_service_reef_request(self, method, endpoint, json_data=None, page=1, page_size=None):
+    def _iter_service_reef(self, endpoint, page_size=None, page=1):
+        """Yield results from a paginated ServiceReef GET endpoint one page at a time.
+        
+        Callers can start on the first page's results while the remaining pages,
+        whose count the first page reveals, are prefetched concurrently. At most
+        max_workers pages are in flight or buffered at a time, so memory stays
+        bounded by a few pages however large the listing is.
+        
+        Args:
+            endpoint: API endpoint (e.g. '/v1/events')
+            page_size: Number of results per page (default: API default)
+            page: Page number to start from (default: 1)
+            
+        Yields:
+            dict: Individual result items
+            
+        Raises:
+            Exception: If a page could not be fetched or was malformed, rather than
+                       yield a truncated listing that reads as removed records
+        """
+        data = self._handle_service_reef_request('GET', endpoint, page=page, page_size=page_size, paginate=False)
+        if data is None:
+            raise Exception(f"Failed to get page {page} of results from {endpoint}")
+            
+        if not (isinstance(data, dict) and 'PageInfo' in data and 'Results' in data):
+            # Not a paginated response
+            if not isinstance(data, list):
+                raise Exception(f"Unexpected non-list results from {endpoint}")
+            yield from data
+            return
+            
+        page_info = data['PageInfo']
+        total_pages = (page_info['TotalRecords'] + page_info['PageSize'] - 1) // page_info['PageSize']
+        self.logger.debug(f"Got page {page_info['Page']} of {total_pages} (Total records: {page_info['TotalRecords']})")
+        
+        yield from data['Results']
+        
+        if page_info['Page'] >= total_pages:
+            return
+            
+        # The first page gives the page count, so prefetch the rest through a sliding
+        # window of futures and yield them in order as the caller consumes them
+        fetch_page = partial(self._handle_service_reef_request, 'GET', endpoint,
+                             page_size=page_info['PageSize'], paginate=False)
+        next_pages = iter(range(page_info['Page'] + 1, total_pages + 1))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque((next_page, executor.submit(fetch_page, page=next_page))
+                            for next_page in islice(next_pages, self.max_workers))
+            try:
+                while pending:
+                    current_page, future = pending.popleft()
+                    data = future.result()
+                    for next_page in islice(next_pages, 1):
+                        pending.append((next_page, executor.submit(fetch_page, page=next_page)))
+                    if not (isinstance(data, dict) and 'Results' in data):
+                        raise Exception(f"Failed to get page {current_page} of results from {endpoint}")
+                    yield from data['Results']
+            finally:
+                # Don't leave prefetches queued once the caller stops early or a page fails
+                for _, future in pending:
+                    future.cancel()
+            
+    def _handle_service_reef_request(self, method, endpoint, json_data=None, page=1, page_size=None, paginate=True):
         """Make a request to the ServiceReef API.
         
         Args:
@@ -3313,6 +3906,7 @@ class EventSyncService:
             json_data: Optional JSON data for POST/PUT requests
             page: Page number for paginated results (default: 1)
             page_size: Number of results per page (default: API default)
+            paginate: If False, return the raw page without following further pages
             
         Returns:
             list/dict: For paginated endpoints, returns list of results.
@@ -3322,44 +3916,39 @@ class EventSyncService:
             Exception: If request fails
         """
         try:
-            # Build URL with pagination params if needed
-            url = f"{self.sr_base_url}{endpoint}"
-            if '?' in endpoint:
-                url += f"&page={page}"
-                if page_size:
-                    url += f"&pageSize={page_size}"
+            # Build URL with pagination params in a single pass
+            separator = '&' if '?' in endpoint else '?'
+            if page_size:
+                url = f"{self.sr_base_url}{endpoint}{separator}page={page}&pageSize={page_size}"
             else:
-                url += f"?page={page}"
-                if page_size:
-                    url += f"&pageSize={page_size}"
+                url = f"{self.sr_base_url}{endpoint}{separator}page={page}"
                     
             # Get access token
             access_token = self.sr_token_service.get_valid_access_token()
             
-            # Prepare headers
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
+            # Prepare headers; the content type is a session default
+            headers = {'Authorization': f'Bearer {access_token}'}
             
             # Make request
-            response = requests.request(method, url, headers=headers, json=json_data)
+            body = orjson.dumps(json_data) if json_data is not None else None
+            response = self.sr_session.request(method, url, headers=headers, data=body, timeout=REQUEST_TIMEOUT)
             
             # Log request details (redacted)
-            self.logger.debug(f'{method} {url}')
-            self.logger.debug(f'Headers: {self._redact_headers(headers)}')
-            if json_data:
-                self.logger.debug(f'Data: {json_data}')
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f'{method} {url}')
+                self.logger.debug(f'Headers: {self._redact_headers(headers)}')
+                if json_data:
+                    self.logger.debug(f'Data: {_compact_json(json_data)}')
             
             # Check response
             if response.ok:
                 if not response.content:
                     return None
                     
-                data = response.json()
+                data = orjson.loads(response.content)
                 
                 # Check if this is a paginated response
-                if isinstance(data, dict) and 'PageInfo' in data and 'Results' in data:
+                if paginate and isinstance(data, dict) and 'PageInfo' in data and 'Results' in data:
                     results = data['Results']
                     page_info = data['PageInfo']
                     
@@ -3367,18 +3956,11 @@ class EventSyncService:
                     total_pages = (page_info['TotalRecords'] + page_info['PageSize'] - 1) // page_info['PageSize']
                     self.logger.debug(f"Got page {page_info['Page']} of {total_pages} (Total records: {page_info['TotalRecords']})")
                     
-                    # If there are more pages, recursively get them
+                    # If there are more pages, fetch them iteratively
                     if page_info['Page'] * page_info['PageSize'] < page_info['TotalRecords']:
-                        next_page = page_info['Page'] + 1
-                        more_results = self._handle_service_reef_request(
-                            method, endpoint, json_data, 
-                            page=next_page, page_size=page_info['PageSize']
-                        )
-                        if more_results:
-                            if isinstance(more_results, list):
-                                results.extend(more_results)
-                            else:
-                                self.logger.warning(f"Unexpected non-list results from page {next_page}")
+                        results.extend(self._iter_service_reef(
+                            endpoint, page_size=page_info['PageSize'], page=page_info['Page'] + 1
+                        ))
                     
                     return results
                 else:
@@ -3392,6 +3974,75 @@ class EventSyncService:
             self.logger.error(f'Error in ServiceReef API request: {str(e)}')
             raise
 
+    def _sync_specific_event_participant(self, nxt_event_id, existing_participants, participant):
+        """Create or update one ServiceReef participant in an NXT event for sync_specific_event.
+        
+        Args:
+            nxt_event_id: NXT event ID
+            existing_participants: List of participants already in the NXT event
+            participant: Dict containing participant data from ServiceReef
+        """
+        try:
+            # Check if participant is a list instead of dict (edge case)
+            if isinstance(participant, list):
+                self.logger.warning(f"Participant data is a list instead of dict: {participant}")
+                # If it's a list with at least one item, use the first item
+                if participant and len(participant) > 0:
+                    participant = participant[0]
+                    self.logger.info(f"Using first item in participant list: {participant}")
+                else:
+                    self.logger.error(f"Empty participant list, skipping")
+                    return
+                    
+            # Safety check for participant being a dictionary
+            if not isinstance(participant, dict):
+                self.logger.error(f"Invalid participant data type: {type(participant)}, expected dict")
+                self.logger.error(f"Participant data: {participant}")
+                return
+            
+            # Get or create constituent
+            constituent_id = self.get_or_create_constituent(participant)
+            if not constituent_id:
+                self.logger.error(f"Failed to get/create constituent for participant {participant.get('FirstName')} {participant.get('LastName')}")
+                return
+                
+            # Add constituent ID to participant data
+            participant['ConstituentId'] = constituent_id
+            
+            # Check if participant already exists in NXT event
+            existing_participant = None
+            if existing_participants:
+                for ep in existing_participants:
+                    # Match by constituent_id
+                    if ep.get('constituent_id') == constituent_id:
+                        existing_participant = ep
+                        break
+                    # Fallback match by name if constituent_id didn't match
+                    elif (ep.get('first_name', '').lower() == participant.get('FirstName', '').lower() and 
+                          ep.get('last_name', '').lower() == participant.get('LastName', '').lower()):
+                        existing_participant = ep
+                        break
+            
+            if existing_participant:
+                # Update existing participant's RSVP status if needed
+                self.logger.info(f"Participant {participant.get('FirstName')} {participant.get('LastName')} already exists in NXT, checking for status updates")
+                self.logger.debug(f"ServiceReef status: {participant.get('RegistrationStatus')}, current NXT status: {existing_participant.get('rsvp_status')}")
+                result = self._update_nxt_participant_status(nxt_event_id, existing_participant, participant)
+                if result:
+                    self.logger.info(f"Successfully updated participant {participant.get('FirstName')} {participant.get('LastName')}'s status in NXT event {nxt_event_id}")
+                else:
+                    self.logger.info(f"No status update needed for participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
+            else:
+                # Create new participant in NXT event
+                self.logger.info(f"Creating new participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
+                result = self._create_nxt_participant(nxt_event_id, participant)
+                if result:
+                    self.logger.info(f"Successfully created participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
+                else:
+                    self.logger.error(f"Failed to create participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
+        except Exception as e:
+            self.logger.error(f"Error syncing participant {participant.get('FirstName')} {participant.get('LastName')}: {str(e)}")
+            
     def sync_specific_event(self, sr_event_id, nxt_event_id, ignore_sync_log=False):
         """Synchronize a specific event and its participants between ServiceReef and NXT.
         
@@ -3434,80 +4085,14 @@ class EventSyncService:
                     if full_name:
                         sr_participant_names.add(full_name)
                 
-                # Load/initialize constituent mapping
-                self._load_mappings()
-                
-                # Get current NXT participants for comparison
-                existing_participants = self._get_all_nxt_event_participants(nxt_event_id)
+                # The NXT participants fetched for the summary above are still current
                 if existing_participants:
                     self.logger.info(f"Found {len(existing_participants)} existing participants in NXT event {nxt_event_id}")
                 
-                # Sync each participant
-                for participant in participants:
-                    try:
-                        # Check if participant is a list instead of dict (edge case)
-                        if isinstance(participant, list):
-                            self.logger.warning(f"Participant data is a list instead of dict: {participant}")
-                            # If it's a list with at least one item, use the first item
-                            if participant and len(participant) > 0:
-                                participant = participant[0]
-                                self.logger.info(f"Using first item in participant list: {participant}")
-                            else:
-                                self.logger.error(f"Empty participant list, skipping")
-                                continue
-                                
-                        # Safety check for participant being a dictionary
-                        if not isinstance(participant, dict):
-                            self.logger.error(f"Invalid participant data type: {type(participant)}, expected dict")
-                            self.logger.error(f"Participant data: {participant}")
-                            continue
-                        
-                        # Get or create constituent
-                        constituent_id = self.get_or_create_constituent(participant)
-                        if not constituent_id:
-                            self.logger.error(f"Failed to get/create constituent for participant {participant.get('FirstName')} {participant.get('LastName')}")
-                            continue
-                            
-                        # Add constituent ID to participant data
-                        participant['ConstituentId'] = constituent_id
-                        
-                        # Check if participant already exists in NXT event
-                        existing_participant = None
-                        if existing_participants:
-                            for ep in existing_participants:
-                                # Match by constituent_id
-                                if ep.get('constituent_id') == constituent_id:
-                                    existing_participant = ep
-                                    break
-                                # Fallback match by name if constituent_id didn't match
-                                elif (ep.get('first_name', '').lower() == participant.get('FirstName', '').lower() and 
-                                      ep.get('last_name', '').lower() == participant.get('LastName', '').lower()):
-                                    existing_participant = ep
-                                    break
-                        
-                        if existing_participant:
-                            # Update existing participant's RSVP status if needed
-                            print(f"\n=== PARTICIPANT UPDATE CHECK: {participant.get('FirstName')} {participant.get('LastName')} ===")
-                            print(f"ServiceReef Status: {participant.get('RegistrationStatus')}")
-                            print(f"Current NXT Status: {existing_participant.get('rsvp_status')}")
-                            self.logger.info(f"Participant {participant.get('FirstName')} {participant.get('LastName')} already exists in NXT, checking for status updates")
-                            result = self._update_nxt_participant_status(nxt_event_id, existing_participant, participant)
-                            if result:
-                                print(f"UPDATE PERFORMED: Status updated in NXT")
-                                self.logger.info(f"Successfully updated participant {participant.get('FirstName')} {participant.get('LastName')}'s status in NXT event {nxt_event_id}")
-                            else:
-                                print(f"NO UPDATE NEEDED: Status is already correct or no change detected")
-                                self.logger.info(f"No status update needed for participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
-                        else:
-                            # Create new participant in NXT event
-                            self.logger.info(f"Creating new participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
-                            result = self._create_nxt_participant(nxt_event_id, participant)
-                            if result:
-                                self.logger.info(f"Successfully created participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
-                            else:
-                                self.logger.error(f"Failed to create participant {participant.get('FirstName')} {participant.get('LastName')} in NXT event {nxt_event_id}")
-                    except Exception as e:
-                        self.logger.error(f"Error syncing participant {participant.get('FirstName')} {participant.get('LastName')}: {str(e)}")
+                # Participants are synced concurrently; mapping writes are lock-guarded
+                sync_participant = partial(self._sync_specific_event_participant, nxt_event_id, existing_participants)
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    list(executor.map(sync_participant, participants))
                 
                 # Handle deletions - participants in NXT that are no longer in ServiceReef
                 if existing_participants:
@@ -3516,6 +4101,13 @@ class EventSyncService:
                     print(f"ServiceReef has {len(participants)} participants")
                     print(f"NXT has {len(existing_participants)} participants")
                     
+                    # NXT constituents mapped from a current ServiceReef participant,
+                    # built once instead of scanning the mapping for every NXT participant
+                    mapped_constituents = {
+                        nxt_id for sr_id, nxt_id in self.constituent_mapping.items()
+                        if sr_id in sr_participant_ids
+                    }
+                    
                     for nxt_participant in existing_participants:
                         participant_id = nxt_participant.get('id')
                         constituent_id = nxt_participant.get('constituent_id')
@@ -3525,10 +4117,8 @@ class EventSyncService:
                         found_in_sr = False
                         
                         # Check by constituent mapping - most reliable method
-                        for sr_id, nxt_id in self.constituent_mapping.items():
-                            if nxt_id == constituent_id and sr_id in sr_participant_ids:
-                                found_in_sr = True
-                                break
+                        if constituent_id in mapped_constituents:
+                            found_in_sr = True
                         
                         # Fallback to name matching if constituent mapping doesn't have it
                         if not found_in_sr and full_name in sr_participant_names:
@@ -3574,14 +4164,12 @@ if __name__ == '__main__':
     console_handler.setFormatter(log_formatter)
     console_handler.setLevel(logging.DEBUG)
     
-    # Root logger
+    # Root logger; the extra handlers run on the background listener thread
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    log_listener.handlers += (file_handler, console_handler)
     
     # Check if we're running with the --force flag to ignore sync log
-    import sys
     force_sync = '--force' in sys.argv
     target_ids = [arg for arg in sys.argv if arg.startswith('--target=')]
     target_name = None
@@ -3594,23 +4182,22 @@ if __name__ == '__main__':
     if target_name:
         root_logger.info(f"Targeting specific participant: {target_name}")
     
-    # Create sync service
-    sync_service = EventSyncService()
-    
-    # Run the sync
-    try:
-        if target_name:
-            # If a specific target was provided, use the specific event sync
-            root_logger.info(f"Syncing specific event: {target_name}")
-            # For backward compatibility, use the hardcoded values when target name is specified
-            sr_event_id = 19818  # MTY Test Trip
-            nxt_event_id = 2024  # MTY Test Trip
-            sync_service.sync_specific_event(sr_event_id, nxt_event_id, ignore_sync_log=force_sync)
-        else:
-            # Otherwise, run the full sync of all events and participants
-            root_logger.info("Running full sync of all ServiceReef events and participants")
-            sync_service.sync_all()
-        
-        logging.info("Sync complete - check sync.log for details")
-    except Exception as e:
-        logging.error(f"Error during sync: {str(e)}")
\ No newline at end of file
+    # Create sync service; leaving the block compacts mappings and closes connections
+    with EventSyncService() as sync_service:
+        # Run the sync
+        try:
+            if target_name:
+                # If a specific target was provided, use the specific event sync
+                root_logger.info(f"Syncing specific event: {target_name}")
+                # For backward compatibility, use the hardcoded values when target name is specified
+                sr_event_id = 19818  # MTY Test Trip
+                nxt_event_id = 2024  # MTY Test Trip
+                sync_service.sync_specific_event(sr_event_id, nxt_event_id, ignore_sync_log=force_sync)
+            else:
+                # Otherwise, run the full sync of all events and participants
+                root_logger.info("Running full sync of all ServiceReef events and participants")
+                sync_service.sync_all()
+            
+            logging.info("Sync complete - check sync.log for details")
+        except Exception as e:
+            logging.error(f"Error during sync: {str(e)}")
\ No newline at end of file